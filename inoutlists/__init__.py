@@ -1,9 +1,30 @@
 __version__ = "1.0.0"
 __all__ = [
-    "load", "Loader", "LoaderXML", "LoaderOFACXML", "LoaderEUXML", "LoaderUNXML",
-    "dump", "Dumper", "DumperJSON", "DumperPandas", "DumperCSV"
+    "load", "iter_load", "load_many", 
+    "Loader", "LoaderXML", "LoaderOFACXML", "LoaderEUXML", "LoaderUNXML", "LoaderJSON",
+    "XMLSchemaCache", "XMLFields", "XMLListEntry", "LoadContext", 
+    "StringInternTable", "NormalizerCache", "JSONBackend",
+    "HTTPClient", "SnapshotCache",
+    "ListEntry", "Name", "Address", "Nationality", "DateOfBirth", "PlaceOfBirth", "Identification",
+    "ListStore", "ListStoreEntry",
+    "diff", "fingerprint", "NameIndex",
+    "dump", "Dumper", "DumperJSON", "DumperJSONL", "DumperPandas", "DumperCSV", 
+    "DumperParquet", "DumperSQLite"
 ]
 __author__ = 'Eusebio José de la Torre Niño <ej.torre.nino@gmail.com>'
 
-from .loaders import load, Loader, LoaderXML, LoaderOFACXML, LoaderEUXML, LoaderUNXML
-from .dumpers import dump, Dumper, DumperJSON, DumperPandas, DumperCSV
\ No newline at end of file
+from .loaders import load, iter_load, load_many
+from .loaders import Loader, LoaderXML, LoaderOFACXML, LoaderEUXML, LoaderUNXML
+from .loaders import LoaderJSON
+from .loaders import XMLSchemaCache, XMLFields, XMLListEntry, LoadContext
+from .loaders import StringInternTable, NormalizerCache
+from .jsonbackends import JSONBackend
+from .sources import HTTPClient
+from .snapshots import SnapshotCache
+from .records import ListEntry, Name, Address, Nationality, DateOfBirth, PlaceOfBirth
+from .records import Identification
+from .stores import ListStore, ListStoreEntry
+from .diffs import diff, fingerprint
+from .indexes import NameIndex
+from .dumpers import dump, Dumper, DumperJSON, DumperJSONL, DumperPandas, DumperCSV
+from .dumpers import DumperParquet, DumperSQLite
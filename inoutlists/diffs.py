@@ -0,0 +1,86 @@
+import hashlib
+import json
+from .records import toDict
+
+__all__ = [
+    "diff",
+    "fingerprint"
+]
+
+_listEntryFields = [
+    "id",
+    "type",
+    "names",
+    "addresses",
+    "nationalities",
+    "dates_of_birth",
+    "places_of_birth",
+    "identifications",
+    "programs",
+    "additional_information"
+]
+
+def fingerprint(listEntry):
+    # Digest of the canonical JSON form of the list entry. Two list entries
+    # with the same content have the same fingerprint whatever the order of
+    # the keys of their dictionaries.
+    canonical = json.dumps(
+        toDict(listEntry),
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(",", ":")
+    )
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+def _indexListEntries(listEntries):
+    index = {}
+    for listEntry in listEntries:
+        listEntry = toDict(listEntry)
+        if listEntry["id"] in index:
+            raise Exception(f"Duplicated list entry id: {listEntry['id']}")
+        index[listEntry["id"]] = listEntry
+    return index
+
+def _getChangedFields(old, new):
+    fields = [field for field in _listEntryFields if field in old or field in new]
+    fields += [field for field in {**old, **new} if field not in _listEntryFields]
+    return [field for field in fields if old.get(field) != new.get(field)]
+
+def diff(old, new):
+    oldMeta = old.get("meta", {}) if isinstance(old, dict) else {}
+    newMeta = new.get("meta", {}) if isinstance(new, dict) else {}
+    oldListEntries = _indexListEntries(
+        old["list_entries"] if isinstance(old, dict) else old
+    )
+    newListEntries = _indexListEntries(
+        new["list_entries"] if isinstance(new, dict) else new
+    )
+    result = {
+        "meta": {
+            "old": oldMeta,
+            "new": newMeta
+        },
+        "added": [],
+        "removed": [],
+        "changed": [],
+        "unchanged": 0
+    }
+    for listEntryId, newListEntry in newListEntries.items():
+        oldListEntry = oldListEntries.get(listEntryId)
+        if oldListEntry is None:
+            result["added"].append(newListEntry)
+        elif fingerprint(oldListEntry) == fingerprint(newListEntry):
+            result["unchanged"] += 1
+        else:
+            result["changed"].append(
+                {
+                    "id": listEntryId,
+                    "fields": _getChangedFields(oldListEntry, newListEntry),
+                    "old": oldListEntry,
+                    "new": newListEntry
+                }
+            )
+    for listEntryId, oldListEntry in oldListEntries.items():
+        if listEntryId not in newListEntries:
+            result["removed"].append(oldListEntry)
+    return result
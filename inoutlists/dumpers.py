@@ -1,15 +1,134 @@
 import json
+import sqlite3
+import csv
+import itertools
+import gzip
+import bz2
+import lzma
+import io
+import contextlib
+from pathlib import Path
+import numpy as np
 import pandas as pd
+from .records import toDict
+from .stores import ListStore
+from .jsonbackends import getJSONBackend
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 __all__ = [
     "dump",
     "Dumper",
     "DumperJSON",
+    "DumperJSONL",
     "DumperPandas",
-    "DumperCSV"
-
+    "DumperCSV",
+    "DumperParquet",
+    "DumperSQLite"
 ]
 
+_compressionOpeners = {
+    "gzip": gzip.open,
+    "bz2": bz2.open,
+    "xz": lzma.open
+}
+if zstandard is not None:
+    # The file objects of the callers are not closed.
+    _compressionOpeners["zstd"] = lambda output, **kwargs: zstandard.open(
+        output, 
+        closefd=not hasattr(output, "write"), 
+        **kwargs
+    )
+
+_compressionSuffixes = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".zst": "zstd"
+}
+
+def _getCompressionOpener(compression):
+    if compression == "zstd" and zstandard is None:
+        raise Exception("zstd compression requires zstandard: pip install inoutlists[zstd]")
+    if compression not in _compressionOpeners:
+        raise Exception(f"Compression not allowed: {compression}")
+    return _compressionOpeners[compression]
+
+def _isBinaryFileObject(fileObject):
+    return isinstance(fileObject, (io.RawIOBase, io.BufferedIOBase)) or \
+           "b" in getattr(fileObject, "mode", "")
+
+@contextlib.contextmanager
+def _wrapBinaryOutput(output, newline=None):
+    # UTF-8 text view of a binary file object, detached (not closed) at
+    # the end.
+    fileOut = io.TextIOWrapper(output, encoding="utf-8", newline=newline)
+    try:
+        yield fileOut
+    finally:
+        fileOut.detach()
+
+def _openTextOutput(output, compression=None, newline=None):
+    # Buffered text file, or a file object that is not closed, compressed
+    # if requested or if the extension of the file is a compression one.
+    # Binary file objects are written in UTF-8.
+    if hasattr(output, "write"):
+        if compression is not None:
+            return _getCompressionOpener(compression)(
+                output, 
+                mode="wt", 
+                encoding="utf-8", 
+                newline=newline
+            )
+        if _isBinaryFileObject(output):
+            return _wrapBinaryOutput(output, newline)
+        return contextlib.nullcontext(output)
+    if compression is None:
+        compression = _compressionSuffixes.get(Path(output).suffix.lower())
+    if compression is None:
+        return open(
+            output, 
+            mode="w", 
+            encoding="utf-8", 
+            newline=newline, 
+            buffering=1024 * 1024
+        )
+    return _getCompressionOpener(compression)(
+        output, 
+        mode="wt", 
+        encoding="utf-8", 
+        newline=newline
+    )
+
+def _openBinaryOutput(output, compression=None):
+    # Buffered binary file, or a file object that is not closed, compressed
+    # if requested or if the extension of the file is a compression one.
+    if hasattr(output, "write"):
+        if compression is None:
+            return contextlib.nullcontext(output)
+        return _getCompressionOpener(compression)(output, mode="wb")
+    if compression is None:
+        compression = _compressionSuffixes.get(Path(output).suffix.lower())
+    if compression is None:
+        return open(output, mode="wb", buffering=1024 * 1024)
+    return _getCompressionOpener(compression)(output, mode="wb")
+
+def _iterListEntries(listEntries):
+    # The chunks of iter_load are returned entry by entry.
+    for listEntry in listEntries:
+        if isinstance(listEntry, list):
+            yield from listEntry
+        else:
+            yield listEntry
+
 class Dumper():
 
     def __init__(self, *args, **kwargs):
@@ -23,13 +142,25 @@ class DumperJSON(Dumper):
 
     def dump(self, data):
         output = self.kwargs.get("output", None)
+        backend = getJSONBackend(self.kwargs.get("backend", "json"))
+        kwargs = self.getJSONKwargs(
+            {
+                k:v for k,v in self.kwargs.items() 
+                if k not in ["output", "backend", "compression"]
+            }
+        )
         if output is None:
-            return json.dumps(data, **self.kwargs)
+            return backend.dumps(data, **kwargs).decode("utf-8")
         else:
-            kwargs = {k:v for k,v in self.kwargs.items() if k != "output"}
             try:
-                with open(output, mode="w", encoding="utf-8") as fileOut:
-                    json.dump(data, fileOut, **kwargs)
+                # The document is encoded in one call, much faster than
+                # writing it piece by piece, and written at once.
+                content = backend.dumps(data, **kwargs)
+                with _openBinaryOutput(output, self.kwargs.get("compression")) as fileOut:
+                    if isinstance(fileOut, io.TextIOBase):
+                        fileOut.write(content.decode("utf-8"))
+                    else:
+                        fileOut.write(content)
                 return True
             except OSError as err:
                 print("OS error:", err)
@@ -38,65 +169,334 @@ class DumperJSON(Dumper):
                 print(f"Unexpected {err=}, {type(err)=}")
                 return False
 
+    @staticmethod
+    def getJSONKwargs(kwargs):
+        # Records and list stores are serialized through their dictionary form.
+        if "default" in kwargs:
+            return kwargs
+        return dict(kwargs, default=DumperJSON.recordDefault)
+
+    @staticmethod
+    def recordDefault(obj):
+        if isinstance(obj, ListStore):
+            return obj.to_list()
+        if hasattr(obj, "to_dict"):
+            return obj.to_dict()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class DumperJSONL(Dumper):
+
+    # JSON Lines: one list entry per line, written as the list entries are
+    # read, so neither the list nor the output are kept in memory.
+
+    def dump(self, data):
+        output = self.kwargs.get("output", None)
+        metaMode = self.kwargs.get("meta", "header")
+        kwargs = DumperJSON.getJSONKwargs(
+            {
+                k:v for k,v in self.kwargs.items() 
+                if k not in ["output", "meta", "compression"]
+            }
+        )
+        if isinstance(data, dict):
+            meta = data.get("meta", {})
+            listEntries = data["list_entries"]
+        else:
+            meta = None
+            listEntries = data
+        if output is None:
+            fileOut = io.StringIO()
+            self.writeLines(fileOut, meta, metaMode, listEntries, kwargs)
+            return fileOut.getvalue()
+        try:
+            with _openTextOutput(output, self.kwargs.get("compression")) as fileOut:
+                self.writeLines(fileOut, meta, metaMode, listEntries, kwargs)
+            if not hasattr(output, "write") and metaMode == "sidecar" and meta is not None:
+                    with open(f"{output}.meta.json", mode="w", encoding="utf-8") as fileOut:
+                        json.dump(meta, fileOut, **kwargs)
+            return True
+        except OSError as err:
+            print("OS error:", err)
+            return False
+        except Exception as err:
+            print(f"Unexpected {err=}, {type(err)=}")
+            return False
+
+    @staticmethod
+    def writeLines(fileOut, meta, metaMode, listEntries, kwargs):
+        if metaMode == "header" and meta is not None:
+            fileOut.write(json.dumps({"meta": meta}, **kwargs) + "\n")
+        for listEntry in _iterListEntries(listEntries):
+            fileOut.write(json.dumps(listEntry, **kwargs) + "\n")
+
 class DumperPandas(Dumper):
 
-    def dump(self, data):        
+    wideRelations = [
+        "names",
+        "addresses",
+        "nationalities",
+        "dates_of_birth",
+        "places_of_birth",
+        "identifications",
+        "programs"
+    ]
 
-        metaFields = [
+    relationFields = {
+        "names": ["whole_name", "strong", "first_name", "last_name"],
+        "addresses": [
+            "address",
+            "street",
+            "city",
+            "country_subdivision",
+            "country_ori",
+            "country_ISO_code",
+            "country_desc"
+        ],
+        "nationalities": ["country_ori", "country_ISO_code", "country_desc"],
+        "dates_of_birth": ["date_of_birth", "year", "month", "day"],
+        "places_of_birth": [
+            "place_of_birth",
+            "street",
+            "city",
+            "country_subdivision",
+            "country_ori",
+            "country_ISO_code",
+            "country_desc"
+        ],
+        "identifications": [
+            "type",
             "id",
-            "type"
+            "country_ori",
+            "country_ISO_code",
+            "country_desc"
         ]
-        
-        recordFields = {
-            "names": {"dict": True},
-            "addresses": {"dict": True},
-            "nationalities": {"dict": True},
-            "dates_of_birth": {"dict": True},
-            "places_of_birth": {"dict": True},
-            "identifications": {"dict": True},
-            "programs": {"dict": False}
-        }
+    }
 
-        df = pd.DataFrame({metafield:[] for metafield in metaFields})
+    def dump(self, data):
+        if self.kwargs.get("relational", False):
+            return self.dumpRelational(data)
+        return self.dumpWide(data)
 
-        for recordFieldName, recordFieldInfo in recordFields.items():
-            dataNorm = [
-                {k:v for k, v in x.items() if k in metaFields + [recordFieldName]}
-                for x in data["list_entries"]
-            ]
-            dataNormUpdate = [
-                x.update({recordFieldName: []}) 
-                for x in dataNorm if recordFieldName not in x.keys()
-            ]
-            if recordFieldInfo["dict"]:
-                dfRecordField = pd.json_normalize(
-                    dataNorm, 
-                    recordFieldName, 
-                    metaFields,
-                    record_prefix = f'{recordFieldName}_'
+    def dumpRelational(self, data):
+        # One data frame per relation, keyed by the id of the list entry,
+        # built in a single pass over the list entries. The number of rows
+        # is the number of values of each relation.
+        columns = {
+            "entries": {"id": [], "type": []},
+            "programs": {"id": [], "program": []},
+            "additional_information": {"id": [], "field": [], "value": []}
+        }
+        for relation, fields in self.relationFields.items():
+            columns[relation] = {"id": []}
+            for field in fields:
+                # The id of an identification is renamed: id is the key.
+                columns[relation]["identification_id" if field == "id" else field] = []
+        for listEntry in data["list_entries"]:
+            listEntry = toDict(listEntry)
+            listEntryId = listEntry["id"]
+            columns["entries"]["id"].append(listEntryId)
+            columns["entries"]["type"].append(listEntry["type"])
+            for relation, fields in self.relationFields.items():
+                relationColumns = columns[relation]
+                for record in listEntry.get(relation, []):
+                    relationColumns["id"].append(listEntryId)
+                    for field in fields:
+                        relationColumns["identification_id" if field == "id" else field].append(
+                            record.get(field, "")
+                        )
+            for program in listEntry.get("programs", []):
+                columns["programs"]["id"].append(listEntryId)
+                columns["programs"]["program"].append(program)
+            for field, value in (listEntry.get("additional_information") or {}).items():
+                columns["additional_information"]["id"].append(listEntryId)
+                columns["additional_information"]["field"].append(field)
+                columns["additional_information"]["value"].append(value)
+        frames = {}
+        for relation in [
+            "entries", 
+            "names", 
+            "addresses", 
+            "nationalities", 
+            "dates_of_birth", 
+            "places_of_birth", 
+            "identifications", 
+            "programs", 
+            "additional_information"
+        ]:
+            frames[relation] = pd.DataFrame(columns[relation])
+        frames["names"]["strong"] = frames["names"]["strong"].astype(bool)
+        return frames
+
+    def dumpWide(self, data):
+        # For every (id, type) the wide data frame is the cartesian product
+        # of the rows of every relation, in this order, with the keys
+        # sorted: the layout of successive outer merges of the relations.
+        # The rows of every relation are indexed once and the product is
+        # expanded with index arithmetic.
+        keys, rows, counts = self.indexRelations(data)
+        maxRows = self.kwargs.get("max_rows", None)
+        if maxRows is not None:
+            rowCount = self.countRows(counts)
+            if rowCount > maxRows:
+                raise Exception(
+                    f"The data frame would have {rowCount} rows, more than max_rows ({maxRows})"
                 )
-            else:
-                dfRecordField = pd.json_normalize(
-                    dataNorm, 
-                    recordFieldName, 
-                    metaFields                    
+        present = np.flatnonzero(counts.sum(axis=1) > 0)
+        if len(present) == 0:
+            return pd.DataFrame({"id": [], "type": []})
+        present = np.array(sorted(present, key=lambda key: keys[key]), dtype=np.int64)
+        factors = np.maximum(counts[present], 1)
+        # strides[:, r] is the number of consecutive rows with the same
+        # value of the relation r: the product of the factors after it.
+        strides = np.ones_like(factors)
+        strides[:, :-1] = np.cumprod(factors[:, :0:-1], axis=1)[:, ::-1]
+        blockSizes = factors.prod(axis=1)
+        blockOfRow = np.repeat(np.arange(len(present)), blockSizes)
+        rowInBlock = np.arange(len(blockOfRow)) - np.repeat(
+            np.cumsum(blockSizes) - blockSizes, 
+            blockSizes
+        )
+        columns = {
+            "id": np.array([keys[key][0] for key in present], dtype=object)[blockOfRow],
+            "type": np.array([keys[key][1] for key in present], dtype=object)[blockOfRow]
+        }
+        for r, relation in enumerate(self.wideRelations):
+            relationRows, relationKeys = rows[relation]
+            if len(relationRows) == 0:
+                continue
+            # Rows of the relation grouped by key, in their original order.
+            order = np.argsort(relationKeys, kind="stable")
+            starts = np.cumsum(counts[:, r]) - counts[:, r]
+            local = (rowInBlock // strides[blockOfRow, r]) % factors[blockOfRow, r]
+            keyOfRow = present[blockOfRow]
+            rowIndex = np.where(
+                counts[keyOfRow, r] > 0,
+                order[np.minimum(starts[keyOfRow] + local, len(order) - 1)],
+                -1
+            )
+            if relation == "programs":
+                columns[relation] = self.takeValues(relationRows, rowIndex)
+                continue
+            fields = list(dict.fromkeys(field for row in relationRows for field in row))
+            for field in fields:
+                columns[f"{relation}_{field}"] = self.takeValues(
+                    [row.get(field, np.nan) for row in relationRows], 
+                    rowIndex
                 )
-                dfRecordField.rename(
-                    columns = {0: recordFieldName},
-                    inplace=True)
-            df = df.merge(dfRecordField, how="outer", on = metaFields)
+        df = pd.DataFrame(columns).infer_objects()
+        if self.kwargs.get("categorical", False):
+            df = self.toCategorical(df)
+        return df
+
+    @staticmethod
+    def wideColumns():
+        columns = ["id", "type"]
+        for relation in DumperPandas.wideRelations:
+            if relation == "programs":
+                columns.append(relation)
+            else:
+                columns += [
+                    f"{relation}_{field}" 
+                    for field in DumperPandas.relationFields[relation]
+                ]
+        return columns
+
+    @staticmethod
+    def iterWideRows(listEntries, missing=""):
+        # Same rows as the wide data frame for every list entry, without
+        # building it: the cartesian product of its relations, names first
+        # and programs last. The values of a missing relation are missing.
+        emptyValues = {
+            relation: [missing] * len(fields) 
+            for relation, fields in DumperPandas.relationFields.items()
+        }
+        emptyValues["programs"] = [missing]
+        for listEntry in listEntries:
+            listEntry = toDict(listEntry)
+            relationValues = []
+            for relation in DumperPandas.wideRelations:
+                records = listEntry.get(relation, [])
+                if relation == "programs":
+                    values = [[program] for program in records]
+                else:
+                    fields = DumperPandas.relationFields[relation]
+                    values = [
+                        [record.get(field, missing) for field in fields] 
+                        for record in records
+                    ]
+                relationValues.append(values)
+            if all(len(values) == 0 for values in relationValues):
+                continue
+            relationValues = [
+                values if len(values) > 0 else [emptyValues[relation]]
+                for relation, values in zip(DumperPandas.wideRelations, relationValues)
+            ]
+            for product in itertools.product(*relationValues):
+                row = [listEntry["id"], listEntry["type"]]
+                for values in product:
+                    row += values
+                yield row
+
+    def indexRelations(self, data):
+        # Single pass over the list entries: the key (id, type) of every
+        # list entry, the rows of every relation with the index of their
+        # key and the number of rows of every relation for every key.
+        keys = {}
+        rows = {relation: ([], []) for relation in self.wideRelations}
+        for listEntry in data["list_entries"]:
+            listEntry = toDict(listEntry)
+            key = keys.setdefault((listEntry["id"], listEntry["type"]), len(keys))
+            for relation in self.wideRelations:
+                records = listEntry.get(relation, [])
+                if len(records) > 0:
+                    relationRows, relationKeys = rows[relation]
+                    relationRows.extend(records)
+                    relationKeys.extend([key] * len(records))
+        counts = np.zeros((len(keys), len(self.wideRelations)), dtype=np.int64)
+        for r, relation in enumerate(self.wideRelations):
+            relationKeys = rows[relation][1]
+            if len(relationKeys) > 0:
+                counts[:, r] = np.bincount(relationKeys, minlength=len(keys))
+        return list(keys), rows, counts
 
+    @staticmethod
+    def countRows(counts):
+        present = counts.sum(axis=1) > 0
+        return int(np.maximum(counts[present], 1).prod(axis=1).sum())
+
+    def estimateRows(self, data):
+        # Number of rows of the wide data frame, without building it.
+        return self.countRows(self.indexRelations(data)[2])
+
+    @staticmethod
+    def takeValues(values, rowIndex):
+        # The index -1 takes the missing value appended at the end.
+        values = np.array(list(values) + [np.nan], dtype=object)
+        return values[rowIndex]
+
+    @staticmethod
+    def toCategorical(df):
+        for column in df.columns:
+            if column in ["type", "programs", "identifications_type"] or \
+               column.endswith(("_country_ISO_code", "_country_desc", "_country_ori")):
+                df[column] = df[column].astype("category")
         return df
     
 class DumperCSV(Dumper):
     
     def dump(self, data):
+        if self.kwargs.get("streaming", False):
+            return self.dumpStreaming(data)
         output = self.kwargs.get("output", None)        
         df = dump(data, dumper=DumperPandas)
+        # The options of the streaming mode are not arguments of to_csv.
+        kwargs = {
+            k:v for k,v in self.kwargs.items() 
+            if k not in ["output", "streaming", "rows_per_part"]
+        }
         if output is None:
-            return df.to_csv(**self.kwargs)
+            return df.to_csv(**kwargs)
         else:
-            kwargs = {k:v for k,v in self.kwargs.items() if k != "output"}
             try:
                 df.to_csv(output, **kwargs)
                 return True
@@ -106,6 +506,354 @@ class DumperCSV(Dumper):
             except Exception as err:
                 print(f"{err=}, {type(err)=}")
                 return False
+
+    # Arguments of the streaming mode. The other arguments of to_csv are
+    # not supported.
+    streamingArguments = [
+        "output", 
+        "streaming", 
+        "rows_per_part", 
+        "compression", 
+        "sep", 
+        "header", 
+        "index"
+    ]
+
+    def dumpStreaming(self, data):
+        # The rows of the wide layout are written with the csv module as
+        # the list entries are read, without building the data frame. As
+        # in to_csv, the first column is the row number unless index is
+        # False.
+        unsupported = [k for k in self.kwargs if k not in self.streamingArguments]
+        if len(unsupported) > 0:
+            raise Exception(
+                f"Arguments not supported with streaming=True: {', '.join(unsupported)}"
+            )
+        output = self.kwargs.get("output", None)
+        rowsPerPart = self.kwargs.get("rows_per_part", None)
+        listEntries = data["list_entries"] if isinstance(data, dict) else data
+        rows = DumperPandas.iterWideRows(_iterListEntries(listEntries))
+        if self.kwargs.get("index", True):
+            rows = ([rowIndex, *row] for rowIndex, row in enumerate(rows))
+        if output is None:
+            fileOut = io.StringIO(newline="")
+            self.writeRows(fileOut, rows)
+            return fileOut.getvalue()
+        try:
+            if rowsPerPart is None:
+                with _openTextOutput(
+                    output, 
+                    self.kwargs.get("compression"), 
+                    newline=""
+                ) as fileOut:
+                    self.writeRows(fileOut, rows)
+            else:
+                self.writeParts(Path(output), rows, rowsPerPart)
+            return True
+        except OSError as err:
+            print("OS error:", err)
+            return False
+        except Exception as err:
+            print(f"{err=}, {type(err)=}")
+            return False
+
+    def getWriter(self, fileOut):
+        return csv.writer(
+            fileOut, 
+            delimiter=self.kwargs.get("sep", ","), 
+            lineterminator="\n"
+        )
+
+    def writeRows(self, fileOut, rows):
+        writer = self.getWriter(fileOut)
+        if self.kwargs.get("header", True):
+            columns = list(DumperPandas.wideColumns())
+            if self.kwargs.get("index", True):
+                columns = [""] + columns
+            writer.writerow(columns)
+        writer.writerows(rows)
+
+    def writeParts(self, outputDir, rows, rowsPerPart):
+        # Part files part-0000.csv, part-0001.csv... of up to rowsPerPart
+        # rows each, in the directory output.
+        if not isinstance(rowsPerPart, int) or rowsPerPart < 1:
+            raise Exception("rows_per_part must be a positive integer")
+        outputDir.mkdir(parents=True, exist_ok=True)
+        compression = self.kwargs.get("compression")
+        suffix = {None: "", "gzip": ".gz", "bz2": ".bz2", "xz": ".xz", "zstd": ".zst"}.get(compression)
+        if suffix is None:
+            raise Exception(f"Compression not allowed: {compression}")
+        part = 0
+        while True:
+            partRows = list(itertools.islice(rows, rowsPerPart))
+            if len(partRows) == 0 and part > 0:
+                break
+            partPath = Path(outputDir, f"part-{part:04d}.csv{suffix}")
+            with _openTextOutput(partPath, compression, newline="") as fileOut:
+                self.writeRows(fileOut, partRows)
+            if len(partRows) < rowsPerPart:
+                break
+            part += 1
             
+class DumperParquet(Dumper):
+
+    # Parquet files of the wide layout or of one file per relation. The
+    # columns with few distinct values are dictionary encoded. pyarrow is
+    # an optional dependency: pip install inoutlists[parquet]
+
+    dictionaryColumns = [
+        "type",
+        "programs",
+        "program",
+        "identifications_type",
+        "field"
+    ]
+
+    def dump(self, data):
+        if pa is None:
+            raise Exception("DumperParquet requires pyarrow: pip install inoutlists[parquet]")
+        output = self.kwargs.get("output", None)
+        if output is None:
+            raise Exception("DumperParquet requires the parameter output")
+        try:
+            if self.kwargs.get("relational", False):
+                self.dumpRelational(data, Path(output))
+            else:
+                self.dumpWide(data, Path(output))
+            return True
+        except OSError as err:
+            print("OS error:", err)
+            return False
+        except Exception as err:
+            print(f"{err=}, {type(err)=}")
+            return False
+
+    def getRowGroupSize(self):
+        return self.kwargs.get("row_group_size", 65536)
+
+    def getWriterKwargs(self, schema):
+        return {
+            "compression": self.kwargs.get("compression", "snappy"),
+            "use_dictionary": [
+                name for name in schema.names 
+                if name in self.dictionaryColumns or 
+                name.endswith(("country_ISO_code", "country_desc", "country_ori"))
+            ]
+        }
+
+    @staticmethod
+    def getSchema(columns):
+        return pa.schema(
+            [
+                (column, pa.bool_() if column.endswith("strong") else pa.string()) 
+                for column in columns
+            ]
+        )
+
+    def dumpWide(self, data, output):
+        if isinstance(data, dict):
+            # The same data frame as DumperPandas.
+            df = DumperPandas().dump(data)
+            schema = self.getSchema(df.columns)
+            table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+            pq.write_table(
+                table, 
+                output, 
+                row_group_size=self.getRowGroupSize(), 
+                **self.getWriterKwargs(schema)
+            )
+            return
+        # An iterator of list entries is written by row groups as it is
+        # read, with all the columns and the rows in the order of the list
+        # entries, as the streaming mode of DumperCSV.
+        columns = DumperPandas.wideColumns()
+        schema = self.getSchema(columns)
+        rows = DumperPandas.iterWideRows(_iterListEntries(data), missing=None)
+        with pq.ParquetWriter(output, schema, **self.getWriterKwargs(schema)) as writer:
+            while True:
+                rowGroup = list(itertools.islice(rows, self.getRowGroupSize()))
+                if len(rowGroup) == 0:
+                    break
+                writer.write_table(
+                    pa.Table.from_pylist(
+                        [dict(zip(columns, row)) for row in rowGroup], 
+                        schema=schema
+                    )
+                )
+
+    def dumpRelational(self, data, outputDir):
+        # One file per relation, <relation>.parquet in the directory output.
+        # The list entries are read in batches; the rows of every relation
+        # are written when they fill a row group.
+        outputDir.mkdir(parents=True, exist_ok=True)
+        listEntries = _iterListEntries(
+            data["list_entries"] if isinstance(data, dict) else data
+        )
+        dumper = DumperPandas(relational=True)
+        writers = {}
+        pending = {}
+        try:
+            while True:
+                batch = list(itertools.islice(listEntries, 1024))
+                frames = dumper.dump({"list_entries": batch})
+                for relation, frame in frames.items():
+                    if relation not in writers:
+                        schema = self.getSchema(frame.columns)
+                        writers[relation] = pq.ParquetWriter(
+                            Path(outputDir, f"{relation}.parquet"), 
+                            schema, 
+                            **self.getWriterKwargs(schema)
+                        )
+                        pending[relation] = []
+                    writer = writers[relation]
+                    pending[relation].append(
+                        pa.Table.from_pandas(frame, schema=writer.schema, preserve_index=False)
+                    )
+                    pendingRows = sum(table.num_rows for table in pending[relation])
+                    if pendingRows >= self.getRowGroupSize() or \
+                       (len(batch) == 0 and pendingRows > 0):
+                        writer.write_table(
+                            pa.concat_tables(pending[relation]), 
+                            row_group_size=self.getRowGroupSize()
+                        )
+                        pending[relation] = []
+                if len(batch) == 0:
+                    break
+        finally:
+            for writer in writers.values():
+                writer.close()
+
+class DumperSQLite(Dumper):
+
+    # SQLite database with the tables of DumperPandas with relational=True
+    # and a meta table. The tables are replaced, the rows inserted by
+    # batches of list entries and the indexes and the full text search table
+    # of the names built in a single transaction: if the load fails the
+    # database keeps its previous tables.
+
+    batchSize = 1024
+
+    def dump(self, data):
+        output = self.kwargs.get("output", None)
+        if output is None:
+            raise Exception("DumperSQLite requires the parameter output")
+        try:
+            fresh = output == ":memory:" or \
+                    not Path(output).exists() or Path(output).stat().st_size == 0
+            # The transaction is managed explicitly: the sqlite3 module
+            # would commit the DDL statements out of it.
+            connection = sqlite3.connect(output, isolation_level=None)
+            try:
+                self.write(connection, data, fresh)
+            finally:
+                connection.close()
+            return True
+        except OSError as err:
+            print("OS error:", err)
+            return False
+        except Exception as err:
+            print(f"{err=}, {type(err)=}")
+            return False
+
+    @staticmethod
+    def getTables():
+        tables = {
+            "entries": ["id", "type"],
+            "programs": ["id", "program"],
+            "additional_information": ["id", "field", "value"]
+        }
+        for relation, fields in DumperPandas.relationFields.items():
+            # The id of an identification is renamed: id is the key.
+            tables[relation] = ["id"] + [
+                "identification_id" if field == "id" else field for field in fields
+            ]
+        return tables
+
+    @staticmethod
+    def iterTableRows(listEntry):
+        listEntry = toDict(listEntry)
+        listEntryId = listEntry["id"]
+        yield "entries", (listEntryId, listEntry["type"])
+        for program in listEntry.get("programs", []):
+            yield "programs", (listEntryId, program)
+        for field, value in (listEntry.get("additional_information") or {}).items():
+            yield "additional_information", (listEntryId, field, value)
+        for relation, fields in DumperPandas.relationFields.items():
+            for record in listEntry.get(relation, []):
+                yield relation, (listEntryId, *[record.get(field, "") for field in fields])
+
+    def write(self, connection, data, fresh=False):
+        tables = self.getTables()
+        if fresh:
+            # A new database has nothing to protect: no rollback journal on
+            # disk and no sync until the end of the load. The settings of an
+            # existing database are not changed.
+            connection.execute("PRAGMA journal_mode = MEMORY")
+            connection.execute("PRAGMA synchronous = OFF")
+        connection.execute("PRAGMA temp_store = MEMORY")
+        connection.execute("PRAGMA cache_size = -65536")
+        listEntries = _iterListEntries(
+            data["list_entries"] if isinstance(data, dict) else data
+        )
+        connection.execute("BEGIN")
+        try:
+            connection.execute("DROP TABLE IF EXISTS names_fts")
+            connection.execute("DROP TABLE IF EXISTS meta")
+            connection.execute("CREATE TABLE meta (key TEXT, value TEXT)")
+            if isinstance(data, dict):
+                connection.executemany(
+                    "INSERT INTO meta VALUES (?, ?)",
+                    [(key, str(value)) for key, value in data.get("meta", {}).items()]
+                )
+            inserts = {}
+            for table, columns in tables.items():
+                connection.execute(f"DROP TABLE IF EXISTS {table}")
+                connection.execute(
+                    f"CREATE TABLE {table} (" + ", ".join(
+                        f"{column} INTEGER" if column == "strong" else f"{column} TEXT"
+                        for column in columns
+                    ) + ")"
+                )
+                inserts[table] = f"INSERT INTO {table} VALUES ({', '.join(['?'] * len(columns))})"
+            while True:
+                batch = list(itertools.islice(listEntries, self.batchSize))
+                if len(batch) == 0:
+                    break
+                rows = {table: [] for table in tables}
+                for listEntry in batch:
+                    for table, row in self.iterTableRows(listEntry):
+                        rows[table].append(row)
+                for table, tableRows in rows.items():
+                    if len(tableRows) > 0:
+                        connection.executemany(inserts[table], tableRows)
+            self.createIndexes(connection, tables)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        if fresh:
+            connection.execute("PRAGMA journal_mode = DELETE")
+        connection.execute("PRAGMA optimize")
+
+    def createIndexes(self, connection, tables):
+        # B-tree indexes are cheaper to build once on the loaded tables
+        # than to update on every insert.
+        for table, columns in tables.items():
+            connection.execute(f"CREATE INDEX {table}_id ON {table} (id)")
+            for column in columns:
+                if column in ["identification_id", "country_ISO_code"]:
+                    connection.execute(
+                        f"CREATE INDEX {table}_{column} ON {table} ({column})"
+                    )
+        if self.kwargs.get("fts", True):
+            # External content table: the names are not stored twice.
+            connection.execute(
+                "CREATE VIRTUAL TABLE names_fts USING fts5("
+                "whole_name, content='names', content_rowid='rowid', "
+                "tokenize='unicode61 remove_diacritics 2')"
+            )
+            connection.execute("INSERT INTO names_fts (names_fts) VALUES ('rebuild')")
+        connection.execute("ANALYZE")
+
 def dump(data, dumper=Dumper, *args, **kwargs):
     return dumper(*args, **kwargs).dump(data)
\ No newline at end of file
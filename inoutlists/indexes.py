@@ -0,0 +1,134 @@
+import math
+import re
+import unicodedata
+from .records import toDict
+
+__all__ = [
+    "NameIndex"
+]
+
+_separators = re.compile(r"[\W_]+")
+
+class NameIndex():
+
+    # Inverted index of the names of one or several lists for fuzzy search.
+    # The features of a name are its tokens and the character trigrams of
+    # its tokens, and the score of a match is the Dice coefficient of the
+    # features of the query and the name. Only the names with one of the
+    # rarest features of the query are scored (prefix filtering), so the
+    # cost of a search depends on the query rather than on the size of the
+    # lists.
+
+    def __init__(self, *results):
+        self.lists = []
+        # (list, id, type) of every list entry.
+        self.entries = []
+        # (entry, whole_name, strong) and features of every indexed name.
+        self.names = []
+        self.nameFeatures = []
+        self.postings = {}
+        for result in results:
+            self.add(result)
+
+    def add(self, result, name=None):
+        # The list of the candidates is name, or the position of the result
+        # in the index if it is not provided.
+        listName = len(self.lists) if name is None else name
+        self.lists.append(listName)
+        listEntries = result["list_entries"] if isinstance(result, dict) else result
+        for listEntry in listEntries:
+            listEntry = toDict(listEntry)
+            entry = len(self.entries)
+            self.entries.append((listName, listEntry["id"], listEntry["type"]))
+            for entryName in listEntry.get("names", []):
+                fullName = " ".join(
+                    part for part in [entryName.get("first_name", ""), entryName.get("last_name", "")]
+                    if part
+                )
+                variants = {
+                    self.getFeatures(self.normalize(value))
+                    for value in [entryName.get("whole_name", ""), fullName]
+                }
+                for features in variants:
+                    if len(features) > 0:
+                        self.addName(entry, entryName, features)
+
+    def addName(self, entry, entryName, features):
+        nameId = len(self.names)
+        self.names.append((entry, entryName.get("whole_name", ""), entryName.get("strong")))
+        self.nameFeatures.append(features)
+        for feature in features:
+            self.postings.setdefault(feature, []).append(nameId)
+
+    @staticmethod
+    def normalize(name):
+        # Upper case without diacritics, the punctuation as spaces.
+        name = unicodedata.normalize("NFKD", name or "")
+        name = "".join(char for char in name if not unicodedata.combining(char))
+        return " ".join(token for token in _separators.split(name.upper()) if token)
+
+    @staticmethod
+    def getFeatures(normalizedName):
+        # The tokens are marked with # (removed by normalize), so a token is
+        # never confused with a trigram.
+        features = set()
+        for token in normalizedName.split():
+            features.add(f"#{token}")
+            padded = f" {token} "
+            features.update(padded[i:i + 3] for i in range(len(padded) - 2))
+        return frozenset(features)
+
+    def search(self, name, threshold=0.8, limit=10):
+        # Best matching name of every list entry with a score of at least
+        # threshold, by decreasing score.
+        if not 0 < threshold <= 1:
+            raise Exception("threshold must be greater than 0 and not greater than 1")
+        query = self.getFeatures(self.normalize(name))
+        querySize = len(query)
+        if querySize == 0:
+            return []
+        # Dice >= threshold needs at least minOverlap common features and
+        # a number of features of the name between minSize and maxSize.
+        minOverlap = max(math.ceil(threshold * querySize / (2 - threshold) - 1e-9), 1)
+        maxSize = math.floor((2 - threshold) * querySize / threshold + 1e-9)
+        features = sorted(query, key=lambda feature: len(self.postings.get(feature, ())))
+        candidates = set()
+        for feature in features[:querySize - minOverlap + 1]:
+            candidates.update(self.postings.get(feature, ()))
+        best = {}
+        for nameId in candidates:
+            nameFeatures = self.nameFeatures[nameId]
+            nameSize = len(nameFeatures)
+            if nameSize < minOverlap or nameSize > maxSize:
+                continue
+            score = 2 * len(query & nameFeatures) / (querySize + nameSize)
+            if score < threshold:
+                continue
+            entry, wholeName, strong = self.names[nameId]
+            if entry not in best or score > best[entry][0]:
+                best[entry] = (score, wholeName, strong)
+        matches = sorted(best.items(), key=lambda match: (-match[1][0], match[0]))
+        if limit is not None:
+            matches = matches[:limit]
+        result = []
+        for entry, (score, wholeName, strong) in matches:
+            listName, listEntryId, listEntryType = self.entries[entry]
+            result.append(
+                {
+                    "list": listName,
+                    "id": listEntryId,
+                    "type": listEntryType,
+                    "whole_name": wholeName,
+                    "strong": strong,
+                    "score": score
+                }
+            )
+        return result
+
+    def info(self):
+        return {
+            "lists": len(self.lists),
+            "entries": len(self.entries),
+            "names": len(self.names),
+            "features": len(self.postings)
+        }
@@ -0,0 +1,93 @@
+import json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+__all__ = [
+    "JSONBackend",
+    "JSONBackendOrjson",
+    "JSONBackendUjson",
+    "getJSONBackend"
+]
+
+class JSONBackend():
+
+    # JSON module of the standard library. All the backends return UTF-8
+    # encoded bytes, so the output can be written to binary files and
+    # streams whatever the backend.
+
+    name = "json"
+
+    def dumps(self, obj, **kwargs):
+        return json.dumps(obj, **kwargs).encode("utf-8")
+
+    def loads(self, data):
+        return json.loads(data)
+
+class JSONBackendOrjson(JSONBackend):
+
+    # orjson only supports some of the keyword arguments of the standard
+    # library. Its output is always compact and UTF-8, so ensure_ascii is
+    # ignored.
+
+    name = "orjson"
+
+    def dumps(self, obj, **kwargs):
+        option = 0
+        for key, value in kwargs.items():
+            if key in ["default", "ensure_ascii"]:
+                continue
+            elif key == "indent":
+                if value in [None, 0]:
+                    continue
+                if value != 2:
+                    raise Exception("The orjson backend only allows indent=2")
+                option |= orjson.OPT_INDENT_2
+            elif key == "sort_keys":
+                if value:
+                    option |= orjson.OPT_SORT_KEYS
+            else:
+                raise Exception(f"Keyword argument not allowed by the orjson backend: {key}")
+        return orjson.dumps(obj, default=kwargs.get("default"), option=option)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+class JSONBackendUjson(JSONBackend):
+
+    name = "ujson"
+
+    def dumps(self, obj, **kwargs):
+        kwargs.setdefault("escape_forward_slashes", False)
+        return ujson.dumps(obj, **kwargs).encode("utf-8")
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+_jsonBackends = {
+    "json": (JSONBackend, json),
+    "orjson": (JSONBackendOrjson, orjson),
+    "ujson": (JSONBackendUjson, ujson)
+}
+
+def getJSONBackend(backend="json"):
+    # The backend can be an object with the methods dumps and loads, the
+    # name of an installed backend or "auto", the fastest one installed.
+    if hasattr(backend, "dumps") and hasattr(backend, "loads"):
+        return backend
+    if backend == "auto":
+        backend = next(
+            name for name in ["orjson", "ujson", "json"]
+            if _jsonBackends[name][1] is not None
+        )
+    if backend not in _jsonBackends:
+        raise Exception(f"JSON backend not allowed: {backend}")
+    backendClass, module = _jsonBackends[backend]
+    if module is None:
+        raise Exception(f"The JSON backend {backend} is not installed: pip install {backend}")
+    return backendClass()
@@ -1,48 +1,251 @@
 import lxml.etree as ET
 import csv
 from pathlib import Path
-import requests
 import os
+import sys
+import threading
+from io import BytesIO, TextIOBase
+from itertools import islice
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import time
 from datetime import datetime
+from .sources import defaultHTTPClient, openDecompressed, openPath
+from .records import ListEntry
+from .stores import ListStore
+from .jsonbackends import getJSONBackend
+from functools import lru_cache
+import hashlib
+import tempfile
+from types import MappingProxyType
 
 __all__ = [
     "load",
+    "iter_load",
+    "load_many",
     "Loader",
     "LoaderXML",
     "LoaderOFACXML",
     "LoaderEUXML",
-    "LoaderUNXML"    
+    "LoaderUNXML",
+    "LoaderJSON",
+    "XMLSchemaCache",
+    "StringInternTable",
+    "NormalizerCache",
+    "XMLFields",
+    "XMLListEntry",
+    "LoadContext"
 ]
 
 _modulePath = Path(os.path.dirname(__file__))
 
+@lru_cache(maxsize=None)
+def _loadReferenceTable(fileName, keyField, valueField, delimiter="\t"):
+    table = {}
+    with open(Path(_modulePath, fileName), 
+              mode="r", 
+              encoding="utf-8") as f:
+        reader = csv.DictReader(f, delimiter=delimiter)
+        for row in reader:
+            table[row[keyField]] = row[valueField]
+    return MappingProxyType(table)
+
+@lru_cache(maxsize=None)
+def _loadReferenceSet(fileName, field, delimiter="\t"):
+    with open(Path(_modulePath, fileName), 
+              mode="r", 
+              encoding="utf-8") as f:
+        reader = csv.DictReader(f, delimiter=delimiter)
+        return frozenset(row[field] for row in reader)
+
+class StringInternTable():
+
+    # Shared table of the normalized low cardinality values (countries,
+    # programs, identification types...). Every distinct value is kept
+    # once and the list entries reference the same string object. The
+    # table stops growing at maxsize distinct values; the new values are
+    # then returned as they are.
+
+    def __init__(self, maxsize=65536):
+        self.maxsize = maxsize
+        self.strings = {}
+        self.hits = 0
+        self.misses = 0
+
+    def intern(self, value):
+        interned = self.strings.get(value)
+        if interned is not None:
+            self.hits += 1
+            return interned
+        self.misses += 1
+        if len(self.strings) >= self.maxsize:
+            return value
+        return self.strings.setdefault(value, value)
+
+    def clear(self):
+        self.strings.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        strings = list(self.strings)
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(strings),
+            "bytes": sum(sys.getsizeof(string) for string in strings)
+        }
+
+class NormalizerCache():
+
+    # Bounded memoization of the normalization functions of a loader
+    # class. The raw values of countries, identification types, programs,
+    # dates... repeat a lot, so most calls are answered from the caches.
+    # Every loader class has its own NormalizerCache.
+
+    def __init__(self, maxsize=65536):
+        self.maxsize = maxsize
+        self.functions = {}
+        self.lock = threading.Lock()
+
+    def memoize(self, name, function):
+        with self.lock:
+            if name not in self.functions:
+                self.functions[name] = lru_cache(maxsize=self.maxsize)(function)
+            return self.functions[name]
+
+    def clear(self):
+        with self.lock:
+            for function in self.functions.values():
+                function.cache_clear()
+
+    def info(self):
+        result = {}
+        with self.lock:
+            for name, function in self.functions.items():
+                cacheInfo = function.cache_info()
+                calls = cacheInfo.hits + cacheInfo.misses
+                result[name] = {
+                    "hits": cacheInfo.hits,
+                    "misses": cacheInfo.misses,
+                    "size": cacheInfo.currsize,
+                    "hit_ratio": cacheInfo.hits / calls if calls > 0 else 0.0
+                }
+        return result
+
+class LoadContext():
+
+    # State of one load: the meta information and, for the XML loaders,
+    # the root element and its namespaces. The loaders only keep their
+    # configuration, so the same loader object can run several loads at
+    # the same time.
+
+    def __init__(self, meta=None):
+        self.meta = {} if meta is None else dict(meta)
+        self.data = None
+        self.ns = None
+
 class Loader():
 
+    # Version of the normalization of the loader. It is part of the key of
+    # the snapshots (see SnapshotCache) and must change when the output of
+    # the loader changes.
+    version = "1"
+    internTable = StringInternTable()
+    normalizerCache = NormalizerCache()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.normalizerCache = NormalizerCache()
+
     def __init__(self, *args, **kwargs):        
         self.meta = {
             "description": kwargs.get("description", "")
         }
         self.args = args
         self.kwargs = kwargs
-        self.countryNames = {}
-        with open(Path(_modulePath, "country_names.csv"), 
-                  mode="r", 
-                  encoding="utf-8") as f:
-            reader = csv.DictReader(f, delimiter="\t")
-            for row in reader:
-                self.countryNames[row["COUNTRY_NAME"]] = row["ISO2_CODE"]
-        self.countryISOCodes = {}
-        with open(Path(_modulePath, "country_ISO_codes.csv"),
-                    mode="r", 
-                    encoding="utf-8") as f:
-            reader = csv.DictReader(f, delimiter="\t")
-            for row in reader:
-                self.countryISOCodes[row["ISO2_CODE"]] = row["COUNTRY_NAME"]
+        self.records = kwargs.get("records", False)
+        self.store = kwargs.get("store", False)
+        self.countryNames = _loadReferenceTable(
+            "country_names.csv", 
+            "COUNTRY_NAME", 
+            "ISO2_CODE"
+        )
+        self.countryISOCodes = _loadReferenceTable(
+            "country_ISO_codes.csv", 
+            "ISO2_CODE", 
+            "COUNTRY_NAME"
+        )
+        # Memoized normalizers, shared by all the loaders of the class. They
+        # only use the class, never a loader object, and the normalized
+        # values are also interned.
+        intern = type(self).internTable.intern
+        stripAdvance = type(self).stripAdvance
+        self.normalizeText = self.normalizerCache.memoize(
+            "normalizeText",
+            lambda string: intern(stripAdvance(string))
+        )
+        self.normalizeUpperText = self.normalizerCache.memoize(
+            "normalizeUpperText",
+            lambda string: intern(stripAdvance(string).upper())
+        )
+        # The country lookups go through the overridable getters, which
+        # may depend on the configuration of the loader object, so every
+        # object has its own memo.
+        self.resolveCountry = lru_cache(
+            maxsize=self.normalizerCache.maxsize
+        )(self.lookupCountry)
 
     def load(self, data):
         pass
 
-    def loadListEntry(self, listEntry):
+    def loadResult(self, data, context):
+        # Result of a load: the meta information of the context and the
+        # list entries, in a list or in a ListStore. The store is complete,
+        # so it is frozen and its numeric columns are read without copies.
+        if self.store:
+            listEntries = ListStore()
+            listEntries.extend(self.iterListEntries(data, context=context))
+            listEntries.freeze()
+        else:
+            listEntries = list(self.iterListEntries(data, context=context))
+        return {
+            "meta": context.meta,
+            "list_entries": listEntries
+        }
+
+    def newContext(self):
+        return LoadContext(self.meta)
+
+    def iterListEntryElements(self, data, context):
+        return []
+
+    def loadListEntries(self, data, context):
+        for listEntry in self.iterListEntryElements(data, context):
+            yield self.loadListEntry(listEntry, context)
+
+    def prepareListEntry(self, listEntry, context):
+        return listEntry
+
+    def iterListEntries(self, data, chunksize=None, context=None):
+        if context is None:
+            context = self.newContext()
+        listEntries = self.loadListEntries(data, context)
+        if self.records:
+            listEntries = (ListEntry.from_dict(listEntry) for listEntry in listEntries)
+        if chunksize is None:
+            yield from listEntries
+        else:
+            if not isinstance(chunksize, int) or chunksize < 1:
+                raise Exception("chunksize must be a positive integer")
+            while True:
+                chunk = list(islice(listEntries, chunksize))
+                if len(chunk) == 0:
+                    break
+                yield chunk
+
+    def loadListEntry(self, listEntry, context=None):
+        listEntry = self.prepareListEntry(listEntry, context)
         result = {            
             "id": self.getId(listEntry),
             "type": self.getType(listEntry),
@@ -102,6 +305,13 @@ class Loader():
     def getAddtionalInformation(self, listEntry):
         pass
     
+    def intern(self, value):
+        return self.internTable.intern(value)
+
+    def lookupCountry(self, countryName):
+        ISOCode = self.getISOCodeFromCountryName(countryName)
+        return ISOCode, self.getCountryNameFromISOCode(ISOCode)
+
     def getISOCodeFromCountryName(self, countryName):
         return self.countryNames.get(countryName, "00")
     
@@ -115,6 +325,8 @@ class Loader():
 
     @staticmethod
     def lxmlGetAttribValue(element, attribName: str):
+        if isinstance(element, XMLFields):
+            element = element.element
         return element.attrib.get(attribName, "").strip()
 
     @staticmethod
@@ -129,97 +341,515 @@ class Loader():
     def stripAdvance(string: str):
         return " ".join(string.split()).strip()
 
+class XMLSchemaCache():
+
+    def __init__(self):
+        self.schemas = {}
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def getSchema(self, xsd):
+        xsdPath = str(Path(xsd).resolve())
+        mtime = os.stat(xsdPath).st_mtime_ns
+        with self.lock:
+            cached = self.schemas.get(xsdPath)
+            if cached is not None and cached[0] == mtime:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+            xmlschema = ET.XMLSchema(ET.parse(xsdPath))
+            self.schemas[xsdPath] = (mtime, xmlschema)
+            return xmlschema
+
+    def invalidate(self, xsd=None):
+        with self.lock:
+            if xsd is None:
+                self.schemas.clear()
+            else:
+                self.schemas.pop(str(Path(xsd).resolve()), None)
+
+    def info(self):
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self.schemas)
+            }
+
+class XMLFields():
+
+    # Children of an element grouped by local tag name in a single walk.
+    # The getters read the list entry fields from here instead of
+    # running an ElementPath search per field.
+
+    __slots__ = ("element", "children", "cache")
+
+    def __init__(self, element):
+        self.element = element
+        self.children = {}
+        self.cache = {}
+        for child in element:
+            tag = child.tag
+            if isinstance(tag, str):
+                name = tag.rpartition("}")[2]
+                if name in self.children:
+                    self.children[name].append(child)
+                else:
+                    self.children[name] = [child]
+
+    def childText(self, name):
+        children = self.children.get(name)
+        if children is None:
+            return ""
+        text = children[0].text
+        return "" if text is None else text.strip()
+
+    def elements(self, name):
+        return self.children.get(name, [])
+
+    def fields(self, name):
+        key = name
+        fields = self.cache.get(key)
+        if fields is None:
+            fields = [XMLFields(element) for element in self.elements(name)]
+            self.cache[key] = fields
+        return fields
+
+    def subElements(self, containerName, name):
+        subElements = []
+        for container in self.children.get(containerName, []):
+            for child in container:
+                tag = child.tag
+                if isinstance(tag, str) and tag.rpartition("}")[2] == name:
+                    subElements.append(child)
+        return subElements
+
+    def subFields(self, containerName, name):
+        key = (containerName, name)
+        subFields = self.cache.get(key)
+        if subFields is None:
+            subFields = [
+                XMLFields(element) 
+                for element in self.subElements(containerName, name)
+            ]
+            self.cache[key] = subFields
+        return subFields
+
+    def attribValue(self, name):
+        return self.element.attrib.get(name, "").strip()
+
+    # Interface of the wrapped element, so the getters written for lxml
+    # elements keep working.
+
+    @property
+    def tag(self):
+        return self.element.tag
+
+    @property
+    def text(self):
+        return self.element.text
+
+    @property
+    def attrib(self):
+        return self.element.attrib
+
+    def find(self, path, namespaces=None):
+        return self.element.find(path, namespaces=namespaces)
+
+    def findall(self, path, namespaces=None):
+        return self.element.findall(path, namespaces=namespaces)
+
+    def findtext(self, path, default=None, namespaces=None):
+        return self.element.findtext(path, default=default, namespaces=namespaces)
+
+    def iterfind(self, path, namespaces=None):
+        return self.element.iterfind(path, namespaces=namespaces)
+
+    def iter(self, *tags):
+        return self.element.iter(*tags)
+
+    def get(self, key, default=None):
+        return self.element.get(key, default)
+
+    def xpath(self, *args, **kwargs):
+        return self.element.xpath(*args, **kwargs)
+
+    def __iter__(self):
+        return iter(self.element)
+
+class XMLListEntry(XMLFields):
+
+    # Fields of a list entry plus its own state: the list entry path where
+    # it was found, the load context and the type, computed only once.
+
+    __slots__ = ("path", "context", "type")
+
+    def __init__(self, element, path, context):
+        super().__init__(element)
+        self.path = path
+        self.context = context
+        self.type = None
+
 class LoaderXML(Loader):
 
+    listEntryPaths = []
+    schemaCache = XMLSchemaCache()
+    workersChunksize = 256
+
+    # The state of a load is kept in its LoadContext.
+
+    @property
+    def ns(self):
+        raise AttributeError("LoaderXML.ns was removed: use listEntry.context.ns")
+
+    @property
+    def data(self):
+        raise AttributeError("LoaderXML.data was removed: use listEntry.context.data")
+
     def __init__(self, 
                  description="", 
-                 schema=Path(_modulePath, "OFAC_xml.xsd")
+                 schema=Path(_modulePath, "OFAC_xml.xsd"),
+                 streaming=False,
+                 workers=None,
+                 http_client=None,
+                 records=False,
+                 store=False,
+                 snapshot_cache=None
         ):
-        super().__init__(description=description, schema=schema)
+        super().__init__(
+            description=description, 
+            schema=schema, 
+            streaming=streaming, 
+            workers=workers,
+            http_client=http_client,
+            records=records,
+            store=store,
+            snapshot_cache=snapshot_cache
+        )
         self.schema = schema
+        self.streaming = streaming
+        self.workers = workers
+        self.httpClient = defaultHTTPClient if http_client is None else http_client
+        self.snapshotCache = snapshot_cache
 
-    def load(self, data_source):        
-        try:
-            if isinstance(data_source, str):
-                if data_source.startswith(('https://', 'http://')):
-                    r = requests.get(data_source)
-                    if r.status_code == 200:
-                        self.data = ET.fromstring(r.content)
-                        self.meta["source"] = data_source
-                    else:
-                        r.raise_for_status()
-                elif os.path.exists(data_source):                    
-                    self.data = ET.parse(data_source).getroot()
-                    self.meta["source"] = data_source
-                else:
-                    self.data = ET.fromstring(data_source)
-                    self.meta["source"] = "String flow"
-            elif isinstance(data_source, Path):
-                self.data = ET.parse(data_source).getroot()
-                self.meta["source"] = str(data_source.resolve())
+    def load(self, data_source):
+        context = self.newContext()
+        snapshotKey = None
+        if self.snapshotCache is not None:
+            data_source, sourceDigest = self.hashSource(data_source, context)
+            snapshotKey = self.snapshotCache.getKey(
+                sourceDigest,
+                self,
+                self.schema,
+                {
+                    k:v for k,v in self.kwargs.items() 
+                    if k in ["description", "records", "store"]
+                }
+            )
+            result = self.snapshotCache.get(snapshotKey)
+            if result is not None:
+                self.closeSource(data_source)
+                result["meta"]["source"] = context.meta["source"]
+                return result
+        result = self.loadResult(data_source, context)
+        if snapshotKey is not None:
+            self.snapshotCache.put(snapshotKey, result)
+        return result
+
+    def hashSource(self, data_source, context):
+        # Returns the data source to parse and the digest of its raw bytes.
+        # A url or a file object is read once to a spooled temporary file
+        # that is hashed while it is written and parsed afterwards.
+        digest = hashlib.sha256()
+        if isinstance(data_source, str) and data_source.startswith(('https://', 'http://')):
+            context.meta["source"] = data_source
+            spool = tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024)
+            with self.httpClient.open(data_source) as stream:
+                for block in iter(lambda: stream.read(1024 * 1024), b""):
+                    digest.update(block)
+                    spool.write(block)
+            spool.seek(0)
+            return spool, digest.hexdigest()
+        elif isinstance(data_source, Path) or \
+             (isinstance(data_source, str) and os.path.exists(data_source)):
+            with open(data_source, mode="rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(block)
+            if isinstance(data_source, Path):
+                context.meta["source"] = str(data_source.resolve())
             else:
-                raise Exception("Data source not allowed")
+                context.meta["source"] = data_source
+        elif isinstance(data_source, str):
+            context.meta["source"] = "String flow"
+            digest.update(data_source.encode("utf-8"))
+        elif hasattr(data_source, "read"):
+            # A file object is read once, as a url.
+            context.meta.setdefault("source", "File object")
+            spool = tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024)
+            while True:
+                block = data_source.read(1024 * 1024)
+                if not block:
+                    break
+                if isinstance(block, str):
+                    block = block.encode("utf-8")
+                digest.update(block)
+                spool.write(block)
+            spool.seek(0)
+            return spool, digest.hexdigest()
+        else:
+            raise Exception("Data source not allowed")
+        return data_source, digest.hexdigest()
+
+    def loadMeta(self, context):
+        pass
+
+    def prepareListEntry(self, listEntry, context):
+        # The list entries of the XML loaders are the tuples
+        # (list entry path, element).
+        listEntryPath, element = listEntry
+        return XMLListEntry(element, listEntryPath, context)
+
+    def getType(self, listEntry):
+        # Other getters also need the type: it is computed once per entry.
+        if listEntry.type is None:
+            listEntry.type = self.getListEntryType(listEntry)
+        return listEntry.type
+
+    def getListEntryType(self, listEntry):
+        return "U"
+
+    def loadListEntries(self, data_source, context):
+        if self.workers is None or self.workers < 2:
+            yield from super().loadListEntries(data_source, context)
+            return
+        # List entries are serialized and normalized by chunks in a pool
+        # of processes. The results are yielded in the original order.
+        loaderKwargs = {
+            k:v for k,v in self.kwargs.items() 
+            if k not in ["workers", "http_client", "snapshot_cache"]
+        }
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            chunk = []
+            for listEntryPath, listEntry in self.iterListEntryElements(data_source, context):
+                chunk.append(
+                    (listEntryPath, ET.tostring(listEntry, with_tail=False))
+                )
+                if len(chunk) == self.workersChunksize:
+                    pending.append(
+                        executor.submit(
+                            _loadListEntriesChunk, 
+                            type(self), 
+                            loaderKwargs, 
+                            context.ns, 
+                            chunk
+                        )
+                    )
+                    chunk = []
+                while len(pending) > 2 * self.workers:
+                    yield from pending.popleft().result()
+            if len(chunk) > 0:
+                pending.append(
+                    executor.submit(
+                        _loadListEntriesChunk, 
+                        type(self), 
+                        loaderKwargs, 
+                        context.ns, 
+                        chunk
+                    )
+                )
+            while len(pending) > 0:
+                yield from pending.popleft().result()
+
+    def iterListEntryElements(self, data_source, context):
+        if self.streaming:
+            yield from self.iterparseListEntries(data_source, context)
+        else:
+            self.parse(data_source, context)
+            self.loadMeta(context)
+            for listEntryPath in self.listEntryPaths:
+                for listEntry in context.data.findall(listEntryPath, namespaces = context.ns):
+                    yield listEntryPath, listEntry
+
+    def parse(self, data_source, context):
+        try:
+            source = self.openSource(data_source, context)
+            try:
+                context.data = ET.parse(source).getroot()
+            finally:
+                self.closeSource(source)
         except Exception as err:
             print(f"{err=}, {type(err)=}")        
 
+        self.checkSchema()
+
+        if not self.schemaValidation(self.schema, context.data):
+            raise Exception(f"Data invalid. Schema: {str(self.schema)}")
+            
+        context.ns = context.data.nsmap
+
+    def iterparseListEntries(self, data_source, context):
+        self.checkSchema()
+        xmlschema = self.schemaCache.getSchema(self.schema)
+        listEntrySteps = {
+            listEntryPath: [
+                step for step in listEntryPath.split("/") if step not in ("", ".")
+            ]
+            for listEntryPath in self.listEntryPaths
+        }
+        source = self.openSource(data_source, context)
+        try:
+            parser = ET.iterparse(
+                source,
+                events=("end",),
+                tag=["{*}" + steps[-1] for steps in listEntrySteps.values()],
+                schema=xmlschema
+            )
+            for _, listEntry in parser:
+                listEntryPath = self.matchListEntryPath(listEntry, listEntrySteps)
+                if listEntryPath is None:
+                    continue
+                if context.data is None:
+                    context.data = listEntry.getroottree().getroot()
+                    context.ns = context.data.nsmap
+                    self.loadMeta(context)
+                yield listEntryPath, listEntry
+                # The list entry is normalized: drop it and the already
+                # processed siblings so the partial tree does not grow.
+                listEntry.clear(keep_tail=True)
+                while listEntry.getprevious() is not None:
+                    del listEntry.getparent()[0]
+            if context.data is None:
+                context.data = parser.root
+                context.ns = context.data.nsmap
+                self.loadMeta(context)
+        except ET.XMLSyntaxError as err:
+            raise Exception(f"Data invalid. Schema: {str(self.schema)}") from err
+        finally:
+            # The partial tree is not kept once the list has been read.
+            context.data = None
+            self.closeSource(source)
+
+    @staticmethod
+    def matchListEntryPath(element, listEntrySteps):
+        for listEntryPath, steps in listEntrySteps.items():
+            if ET.QName(element).localname != steps[-1]:
+                continue
+            if len(steps) > 1:
+                parent = element.getparent()
+                if parent is None or ET.QName(parent).localname != steps[-2]:
+                    continue
+            return listEntryPath
+        return None
+
+    def openSource(self, data_source, context):
+        if isinstance(data_source, str):
+            if data_source.startswith(('https://', 'http://')):
+                source = openDecompressed(self.httpClient.open(data_source))
+                context.meta["source"] = data_source
+                return source
+            elif os.path.exists(data_source):
+                context.meta["source"] = data_source
+                return openPath(data_source)
+            else:
+                context.meta["source"] = "String flow"
+                return BytesIO(data_source.encode("utf-8"))
+        elif isinstance(data_source, Path):
+            context.meta["source"] = str(data_source.resolve())
+            return openPath(str(data_source))
+        elif hasattr(data_source, "read"):
+            context.meta.setdefault("source", "File object")
+            return openDecompressed(data_source)
+        else:
+            raise Exception("Data source not allowed")
+
+    @staticmethod
+    def closeSource(source):
+        if hasattr(source, "close"):
+            source.close()
+
+    def checkSchema(self):
         if self.schema is None:
             raise Exception("The loader class must provide a path to a schema")
         
         if not isinstance(self.schema, Path):
             raise Exception("The schema must be a Path object")
 
-        if not self.schemaValidation(self.schema):
-            raise Exception(f"Data invalid. Schema: {str(self.schema)}")
-            
-        self.ns = self.data.nsmap
-
-    def schemaValidation(self, xsd):
-        xmlschema_doc = ET.parse(xsd)
-        xmlschema = ET.XMLSchema(xmlschema_doc)
-        return xmlschema.validate(self.data)
+    def schemaValidation(self, xsd, data):
+        xmlschema = self.schemaCache.getSchema(xsd)
+        return xmlschema.validate(data)
+
+_OFACMonths = MappingProxyType(
+    {
+        "Jan": "01",
+        "Feb": "02",
+        "Mar": "03",
+        "Apr": "04",            
+        "May": "05",
+        "Jun": "06",
+        "Jul": "07",
+        "Aug": "08",
+        "Sep": "09",
+        "Oct": "10",
+        "Nov": "11",
+        "Dec": "12"
+    }
+)
 
 class LoaderOFACXML(LoaderXML):
 
+    listEntryPaths = ["sdnEntry"]
+
     def __init__(self, 
                  description="", 
-                 schema=Path(_modulePath, "OFAC_xml.xsd")
+                 schema=Path(_modulePath, "OFAC_xml.xsd"),
+                 streaming=False,
+                 workers=None,
+                 http_client=None,
+                 records=False,
+                 store=False,
+                 snapshot_cache=None
         ):
-        super().__init__(description=description, schema=schema)
-        self.allowedIdTypes = []
-        with open(Path(_modulePath, "./OFAC_id_Types.csv"), 
-                  mode="r", 
-                  encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                self.allowedIdTypes.append(row["OFAC_ID_TYPE"])
-
-    def load(self, data_source):        
-        super().load(data_source)
+        super().__init__(
+            description=description, 
+            schema=schema, 
+            streaming=streaming, 
+            workers=workers,
+            http_client=http_client,
+            records=records,
+            store=store,
+            snapshot_cache=snapshot_cache
+        )
+        self.allowedIdTypes = _loadReferenceSet(
+            "OFAC_Id_Types.csv", 
+            "OFAC_ID_TYPE", 
+            delimiter=","
+        )
+        self.normalizeOFACDate = self.normalizerCache.memoize(
+            "getISODateFromOFACDate",
+            type(self).getISODateFromOFACDate
+        )
+
+    def loadMeta(self, context):
         listDateTxt = self.lxmlFindText(
-                        self.data, 
+                        context.data, 
                         "publshInformation/Publish_Date",
-                        self.ns
+                        context.ns
                     )
         try:
             listDateDt = datetime.strptime(listDateTxt, '%m/%d/%Y').date()
-            self.meta["list_date"] = listDateDt.isoformat()
-            listEntries = []
+            context.meta["list_date"] = listDateDt.isoformat()
         except Exception as err:
             print(f"{err=}, {type(err)=}")
-            self.meta["list_date"] = ""
-        for listEntry in self.data.findall(".//sdnEntry", namespaces = self.ns):
-            listEntries.append(self.loadListEntry(listEntry))
-        return {
-            "meta": self.meta,
-            "list_entries": listEntries
-        }
+            context.meta["list_date"] = ""
     
     def getId(self, listEntry):
-        return self.lxmlFindText(listEntry, "uid", self.ns)    
+        return listEntry.childText("uid")
     
-    def getType(self, listEntry):
+    def getListEntryType(self, listEntry):
         
-        sdnType = self.lxmlFindText(listEntry, "sdnType", self.ns)
+        sdnType = listEntry.childText("sdnType")
 
         if sdnType == "Entity":
             return "O"
@@ -240,16 +870,16 @@ class LoaderOFACXML(LoaderXML):
 
         # Main Name
 
-        first_nameOFAC = self.lxmlFindText(listEntry, "firstName", self.ns)
-        last_nameOFAC = self.lxmlFindText(listEntry, "lastName", self.ns)        
+        first_nameOFAC = listEntry.childText("firstName")
+        last_nameOFAC = listEntry.childText("lastName")
         names.append(self.getNameOFAC("strong", first_nameOFAC, last_nameOFAC, entityType))
 
         # Aliases
                 
-        for aliasEl in listEntry.findall("akaList/aka", namespaces = self.ns):            
-            category = self.lxmlFindText(aliasEl, "category", self.ns) 
-            first_nameOFAC = self.lxmlFindText(aliasEl, "firstName", self.ns)
-            last_nameOFAC = self.lxmlFindText(aliasEl, "lastName", self.ns)            
+        for alias in listEntry.subFields("akaList", "aka"):
+            category = alias.childText("category")
+            first_nameOFAC = alias.childText("firstName")
+            last_nameOFAC = alias.childText("lastName")
             names.append(self.getNameOFAC(category, first_nameOFAC, last_nameOFAC, entityType))
 
         return self.dedupDictsList(names)    
@@ -275,18 +905,17 @@ class LoaderOFACXML(LoaderXML):
 
         addresses = []
 
-        for addressEl in listEntry.findall("addressList/address", namespaces = self.ns):            
+        for addressFields in listEntry.subFields("addressList", "address"):
             
-            street1 = self.lxmlFindText(addressEl, "address1", self.ns)
-            street2 = self.lxmlFindText(addressEl, "address2", self.ns)
-            street3 = self.lxmlFindText(addressEl, "address2", self.ns)
+            street1 = addressFields.childText("address1")
+            street2 = addressFields.childText("address2")
+            street3 = addressFields.childText("address2")
             street = " ".join([street1, street2, street3])            
-            city = self.lxmlFindText(addressEl, "city", self.ns)
-            country_subdivision = self.lxmlFindText(addressEl, "stateOrProvince", self.ns)
-            country_ori = self.lxmlFindText(addressEl, "country", self.ns)
-            country_ori= self.stripAdvance(country_ori).upper()
-            country_ISO_code = self.getISOCodeFromCountryName(country_ori)
-            country_desc = self.getCountryNameFromISOCode(country_ISO_code)
+            city = addressFields.childText("city")
+            country_subdivision = addressFields.childText("stateOrProvince")
+            country_ori = addressFields.childText("country")
+            country_ori= self.normalizeUpperText(country_ori)
+            country_ISO_code, country_desc = self.resolveCountry(country_ori)
             address = " ".join(
                 [
                     street,
@@ -314,19 +943,18 @@ class LoaderOFACXML(LoaderXML):
     def getNationalities(self, listEntry):
 
         nationalitiesPaths = [
-            "nationalityList/nationality",
-            "citizenshipList/citizenship"
+            ("nationalityList", "nationality"),
+            ("citizenshipList", "citizenship")
         ]
 
         nationalities = []
 
-        for nationalitiesPath in nationalitiesPaths:
-            for nationalityEL in listEntry.findall(nationalitiesPath, namespaces = self.ns):
-                nationality_ori = self.lxmlFindText(nationalityEL, "country", self.ns)
-                nationality_ori = self.stripAdvance(nationality_ori).upper()
+        for containerName, name in nationalitiesPaths:
+            for nationalityFields in listEntry.subFields(containerName, name):
+                nationality_ori = nationalityFields.childText("country")
+                nationality_ori = self.normalizeUpperText(nationality_ori)
                 if len(nationality_ori) > 0:
-                    country_ISO_code = self.getISOCodeFromCountryName(nationality_ori)
-                    country_desc = self.getCountryNameFromISOCode(country_ISO_code)
+                    country_ISO_code, country_desc = self.resolveCountry(nationality_ori)
                     nationalities.append(
                         {
                             "country_ori": nationality_ori,
@@ -340,11 +968,10 @@ class LoaderOFACXML(LoaderXML):
     def getDatesOfBirth(self, listEntry):
 
         datesOfBirth = []
-        xpath = "dateOfBirthList/dateOfBirthItem"
 
-        for dobEl in listEntry.findall(xpath, namespaces = self.ns):            
-            dobOFAC = self.lxmlFindText(dobEl, "dateOfBirth", self.ns)
-            dob =  self.getISODateFromOFACDate(dobOFAC)
+        for dobFields in listEntry.subFields("dateOfBirthList", "dateOfBirthItem"):
+            dobOFAC = dobFields.childText("dateOfBirth")
+            dob = self.normalizeOFACDate(dobOFAC)
             if dob is not None:            
                 dobParts = dob.split("-")
                 datesOfBirth.append(
@@ -361,27 +988,13 @@ class LoaderOFACXML(LoaderXML):
     @staticmethod
     def getISODateFromOFACDate(OFACDate):
 
-        OFACMonths = {
-            "Jan": "01",
-            "Feb": "02",
-            "Mar": "03",
-            "Apr": "04",            
-            "May": "05",
-            "Jun": "06",
-            "Jul": "07",
-            "Aug": "08",
-            "Sep": "09",
-            "Oct": "10",
-            "Nov": "11",
-            "Dec": "12"
-        }
         OFACDateParts = OFACDate.split(" ")
         if len(OFACDateParts) == 0:
             return None
         elif len(OFACDateParts) == 1:
             return f'{OFACDateParts[0]}'
         elif len(OFACDateParts) == 3:
-            month = OFACMonths.get(OFACDateParts[1],"")
+            month = _OFACMonths.get(OFACDateParts[1],"")
             if len(month) == 0:
                 return f'{OFACDateParts[2]}'                
             else:                
@@ -392,10 +1005,9 @@ class LoaderOFACXML(LoaderXML):
     def getPlacesOfBirth(self, listEntry):
 
         placesOfBirth = []
-        xpath = "placeOfBirthList/placeOfBirthItem"
 
-        for pobEl in listEntry.findall(xpath, namespaces = self.ns):
-            pob = self.lxmlFindText(pobEl, "placeOfBirth", self.ns)
+        for pobFields in listEntry.subFields("placeOfBirthList", "placeOfBirthItem"):
+            pob = pobFields.childText("placeOfBirth")
             pob =  self.stripAdvance(pob)
             if len(pob) > 0:
                 countryOfBirth = self.getCountryOfBirthOFAC(pob)
@@ -415,9 +1027,8 @@ class LoaderOFACXML(LoaderXML):
     
     def getCountryOfBirthOFAC(self, pob):
         pobParts = pob.split(",")
-        country_ori = self.stripAdvance(pobParts[-1]).upper()
-        country_ISO_code = self.getISOCodeFromCountryName(country_ori)
-        country_desc = self.getCountryNameFromISOCode(country_ISO_code)        
+        country_ori = self.normalizeUpperText(pobParts[-1])
+        country_ISO_code, country_desc = self.resolveCountry(country_ori)
         return {
             "country_ori": "" if country_ISO_code == "00" else country_ori,
             "country_ISO_code": country_ISO_code,
@@ -428,17 +1039,16 @@ class LoaderOFACXML(LoaderXML):
         
         identifications = []
 
-        for IdEl in listEntry.findall("idList/id", namespaces = self.ns):
-            idType = self.lxmlFindText(IdEl, "idType", self.ns)
-            idNumber = self.lxmlFindText(IdEl, "idNumber", self.ns)
+        for idFields in listEntry.subFields("idList", "id"):
+            idType = idFields.childText("idType")
+            idNumber = idFields.childText("idNumber")
             if idType in self.allowedIdTypes and len(idNumber) > 0:
-                country_ori = self.lxmlFindText(IdEl, "idCountry", self.ns)
-                country_ori = self.stripAdvance(country_ori).upper()
-                country_ISO_code = self.getISOCodeFromCountryName(country_ori)
-                country_desc = self.getCountryNameFromISOCode(country_ISO_code)
+                country_ori = idFields.childText("idCountry")
+                country_ori = self.normalizeUpperText(country_ori)
+                country_ISO_code, country_desc = self.resolveCountry(country_ori)
                 identifications.append(
                     {
-                        "type": self.stripAdvance(idType).upper(),
+                        "type": self.normalizeUpperText(idType),
                         "id": idNumber,
                         "country_ori": country_ori,
                         "country_ISO_code": country_ISO_code,
@@ -451,9 +1061,9 @@ class LoaderOFACXML(LoaderXML):
     def getPrograms(self, listEntry):
          
          programs = []
-         for prEl in listEntry.findall("programList/program", namespaces = self.ns):
+         for prEl in listEntry.subElements("programList", "program"):
              if prEl.text is not None:
-                programs.append(self.stripAdvance(prEl.text))
+                programs.append(self.normalizeText(prEl.text))
 
          return self.dedupList(programs)
     
@@ -461,25 +1071,13 @@ class LoaderOFACXML(LoaderXML):
 
         result = {}
 
-        remark = self.stripAdvance(
-                self.lxmlFindText(
-                    listEntry, 
-                    "remarks", 
-                    self.ns
-                )
-            )
+        remark = self.stripAdvance(listEntry.childText("remarks"))
         if len(remark) > 0:
             result["remarks"] = remark
         
-        for IdEl in listEntry.findall("idList/id", namespaces = self.ns):
-            idType = self.lxmlFindText(IdEl, "idType", self.ns)
-            idNumber = self.stripAdvance(
-                            self.lxmlFindText(
-                                IdEl, 
-                                "idNumber", 
-                                self.ns
-                            )
-                        )
+        for idFields in listEntry.subFields("idList", "id"):
+            idType = idFields.childText("idType")
+            idNumber = self.stripAdvance(idFields.childText("idNumber"))
             if idType not in self.allowedIdTypes and len(idNumber) > 0:                
                 idType = self.stripAdvance(idType)
                 idType = idType.replace(" ", "_")
@@ -491,31 +1089,40 @@ class LoaderOFACXML(LoaderXML):
 
 class LoaderEUXML(LoaderXML):
 
+    listEntryPaths = ["sanctionEntity"]
+
     def __init__(self, 
                  description="", 
-                 schema=Path(_modulePath, "EU_20171012-FULL-schema-1_1(xsd).xsd")
+                 schema=Path(_modulePath, "EU_20171012-FULL-schema-1_1(xsd).xsd"),
+                 streaming=False,
+                 workers=None,
+                 http_client=None,
+                 records=False,
+                 store=False,
+                 snapshot_cache=None
         ):
-        super().__init__(description=description, schema=schema)
-
-    def load(self, data_source):
-        super().load(data_source)
-        self.meta["list_date"] = self.lxmlGetAttribValue(self.data, "generationDate")        
-        listEntries = []
-        for listEntry in self.data.findall(".//sanctionEntity", namespaces = self.ns):
-            listEntries.append(self.loadListEntry(listEntry))
-        return {
-            "meta": self.meta,
-            "list_entries": listEntries
-        }
+        super().__init__(
+            description=description, 
+            schema=schema, 
+            streaming=streaming, 
+            workers=workers,
+            http_client=http_client,
+            records=records,
+            store=store,
+            snapshot_cache=snapshot_cache
+        )
+
+    def loadMeta(self, context):
+        context.meta["list_date"] = self.lxmlGetAttribValue(context.data, "generationDate")        
     
     def getId(self, listEntry):
-        return self.lxmlGetAttribValue(listEntry, "euReferenceNumber")
+        return listEntry.attribValue("euReferenceNumber")
     
-    def getType(self, listEntry):
+    def getListEntryType(self, listEntry):
 
-        euTypeEl = listEntry.find("subjectType", namespaces = self.ns)        
-        if euTypeEl is not None:            
-            euType = self.lxmlGetAttribValue(euTypeEl, "classificationCode")
+        euTypeEls = listEntry.elements("subjectType")
+        if len(euTypeEls) > 0:
+            euType = self.lxmlGetAttribValue(euTypeEls[0], "classificationCode")
         else:
             euType = ""
 
@@ -530,7 +1137,7 @@ class LoaderEUXML(LoaderXML):
 
         names = []
 
-        for nameEl in listEntry.findall("nameAlias", namespaces = self.ns):            
+        for nameEl in listEntry.elements("nameAlias"):            
             strong = True if self.lxmlGetAttribValue(nameEl, "strong") == "true" else False
             first_nameEU = self.lxmlGetAttribValue(nameEl, "firstName")
             middle_nameEU = self.lxmlGetAttribValue(nameEl, "middleName")
@@ -552,7 +1159,7 @@ class LoaderEUXML(LoaderXML):
 
         addresses = []
 
-        for addressEl in listEntry.findall("address", namespaces = self.ns):
+        for addressEl in listEntry.elements("address"):
             street = self.lxmlGetAttribValue(addressEl, "street")
             city = " ".join(
                 [
@@ -562,7 +1169,7 @@ class LoaderEUXML(LoaderXML):
             )            
             country_subdivision = self.lxmlGetAttribValue(addressEl, "region")
             country_ori = self.lxmlGetAttribValue(addressEl, "countryDescription")
-            country_ori = self.stripAdvance(country_ori).upper()
+            country_ori = self.normalizeUpperText(country_ori)
             address = " ".join(
                 [
                     street,
@@ -573,8 +1180,7 @@ class LoaderEUXML(LoaderXML):
             )
             address = self.stripAdvance(address)
             if len(address) > 0:
-                country_ISO_code = self.getISOCodeFromCountryName(country_ori)
-                country_desc = self.getCountryNameFromISOCode(country_ISO_code)
+                country_ISO_code, country_desc = self.resolveCountry(country_ori)
                 addresses.append(
                     {
                         "address": address.upper(),
@@ -593,12 +1199,11 @@ class LoaderEUXML(LoaderXML):
 
         nationalities = []
 
-        for nationalityEl in listEntry.findall("citizenship", namespaces = self.ns):
+        for nationalityEl in listEntry.elements("citizenship"):
             nationality_ori = self.lxmlGetAttribValue(nationalityEl, "countryDescription")
-            nationality_ori = self.stripAdvance(nationality_ori).upper()
+            nationality_ori = self.normalizeUpperText(nationality_ori)
             if len(nationality_ori) > 0 and nationality_ori != "UNKNOWN":
-                country_ISO_code = self.getISOCodeFromCountryName(nationality_ori)
-                country_desc = self.getCountryNameFromISOCode(country_ISO_code)
+                country_ISO_code, country_desc = self.resolveCountry(nationality_ori)
                 nationalities.append(
                     {
                         "country_ori": nationality_ori,
@@ -613,7 +1218,7 @@ class LoaderEUXML(LoaderXML):
 
         datesOfBirth = []
 
-        for dobEl in listEntry.findall("birthdate", namespaces = self.ns):
+        for dobEl in listEntry.elements("birthdate"):
 
             yearIni = self.lxmlGetAttribValue(dobEl, "yearRangeFrom")
             yearEnd = self.lxmlGetAttribValue(dobEl, "yearRangeTo")
@@ -656,7 +1261,7 @@ class LoaderEUXML(LoaderXML):
 
         placesOfBirth = []
 
-        for pobEl in listEntry.findall("birthdate", namespaces = self.ns):
+        for pobEl in listEntry.elements("birthdate"):
             street = ""
             city = " ".join(
                 [
@@ -666,7 +1271,7 @@ class LoaderEUXML(LoaderXML):
             )
             country_subdivision = self.lxmlGetAttribValue(pobEl, "region")            
             country_ori = self.lxmlGetAttribValue(pobEl, "countryDescription")
-            country_ori = self.stripAdvance(country_ori).upper()
+            country_ori = self.normalizeUpperText(country_ori)
             pob = " ".join(
                     [
                         street,
@@ -677,8 +1282,7 @@ class LoaderEUXML(LoaderXML):
                 )               
             pob = self.stripAdvance(pob)
             if len(pob) > 0:
-                country_ISO_code = self.getISOCodeFromCountryName(country_ori)
-                country_desc = self.getCountryNameFromISOCode(country_ISO_code)
+                country_ISO_code, country_desc = self.resolveCountry(country_ori)
                 placesOfBirth.append(
                     {
                         "place_of_birth": pob.upper(),
@@ -697,17 +1301,16 @@ class LoaderEUXML(LoaderXML):
 
         identifications = []
 
-        for IdEl in listEntry.findall("identification", namespaces = self.ns):
+        for IdEl in listEntry.elements("identification"):
             idNumber =  self.lxmlGetAttribValue(IdEl, "number")
             if len(idNumber) > 0:
                 idType = self.lxmlGetAttribValue(IdEl, "identificationTypeDescription")
                 country_ori = self.lxmlGetAttribValue(IdEl, "countryDescription")
-                country_ori = self.stripAdvance(country_ori).upper()
-                country_ISO_code = self.getISOCodeFromCountryName(country_ori)
-                country_desc = self.getCountryNameFromISOCode(country_ISO_code)
+                country_ori = self.normalizeUpperText(country_ori)
+                country_ISO_code, country_desc = self.resolveCountry(country_ori)
                 identifications.append(
                     {
-                        "type": self.stripAdvance(idType).upper(),
+                        "type": self.normalizeUpperText(idType),
                         "id": idNumber,
                         "country_ori": country_ori,
                         "country_ISO_code": country_ISO_code,
@@ -719,10 +1322,10 @@ class LoaderEUXML(LoaderXML):
     
     def getPrograms(self, listEntry):
          
-        regulationEl = listEntry.find("regulation", namespaces = self.ns)
-        if regulationEl is not None:
-            program = self.stripAdvance(
-                self.lxmlGetAttribValue(regulationEl, "programme")
+        regulationEls = listEntry.elements("regulation")
+        if len(regulationEls) > 0:
+            program = self.normalizeText(
+                self.lxmlGetAttribValue(regulationEls[0], "programme")
             )
         else:
             program = ""
@@ -736,7 +1339,7 @@ class LoaderEUXML(LoaderXML):
         result = {}
         
         remarks = []
-        for remarkEL in listEntry.findall("remark", namespaces = self.ns):
+        for remarkEL in listEntry.elements("remark"):
             if remarkEL is not None:
                 remarks.append(remarkEL.text)
 
@@ -750,41 +1353,42 @@ class LoaderEUXML(LoaderXML):
     
 class LoaderUNXML(LoaderXML):
 
+    listEntryPaths = [
+        "INDIVIDUALS/INDIVIDUAL",
+        "ENTITIES/ENTITY"
+    ]
+
     def __init__(self, 
                  description="", 
-                 schema=Path(_modulePath, "UN_consolidated.xsd")
+                 schema=Path(_modulePath, "UN_consolidated.xsd"),
+                 streaming=False,
+                 workers=None,
+                 http_client=None,
+                 records=False,
+                 store=False,
+                 snapshot_cache=None
         ):
-        super().__init__(description=description, schema=schema)
+        super().__init__(
+            description=description, 
+            schema=schema, 
+            streaming=streaming, 
+            workers=workers,
+            http_client=http_client,
+            records=records,
+            store=store,
+            snapshot_cache=snapshot_cache
+        )
     
-    def load(self, data_source):
-        super().load(data_source)
-        self.listEntryPath = ""
-        self.meta["list_date"] = self.lxmlGetAttribValue(self.data, "dateGenerated")
-        
-        listEntries = []
-        listEntryPaths = [
-            ".//INDIVIDUALS/INDIVIDUAL",
-            ".//ENTITIES/ENTITY"
-        ]
-        for listEntryPath in listEntryPaths:
-            self.listEntryPath = listEntryPath
-            for listEntry in self.data.findall(
-                listEntryPath,
-                namespaces=self.ns):
-                listEntries.append(self.loadListEntry(listEntry))
-
-        return {
-            "meta": self.meta,
-            "list_entries": listEntries
-        }
+    def loadMeta(self, context):
+        context.meta["list_date"] = self.lxmlGetAttribValue(context.data, "dateGenerated")
     
     def getId(self, listEntry):
-        return self.lxmlFindText(listEntry, "REFERENCE_NUMBER", self.ns)
+        return listEntry.childText("REFERENCE_NUMBER")
     
-    def getType(self, listEntry):
-        if self.listEntryPath == ".//INDIVIDUALS/INDIVIDUAL":
+    def getListEntryType(self, listEntry):
+        if listEntry.path == "INDIVIDUALS/INDIVIDUAL":
             return "I"
-        elif self.listEntryPath == ".//ENTITIES/ENTITY":
+        elif listEntry.path == "ENTITIES/ENTITY":
             return "O"
         else:
             return "U"
@@ -797,10 +1401,10 @@ class LoaderUNXML(LoaderXML):
         
         # Main Name        
 
-        first_nameUN = self.lxmlFindText(listEntry, "FIRST_NAME", self.ns)
-        second_nameUN = self.lxmlFindText(listEntry, "SECOND_NAME", self.ns)
-        third_nameUN = self.lxmlFindText(listEntry, "THIRD_NAME", self.ns)
-        fourth_nameUN = self.lxmlFindText(listEntry, "FOURTH_NAME", self.ns)
+        first_nameUN = listEntry.childText("FIRST_NAME")
+        second_nameUN = listEntry.childText("SECOND_NAME")
+        third_nameUN = listEntry.childText("THIRD_NAME")
+        fourth_nameUN = listEntry.childText("FOURTH_NAME")
 
         if entityType == "I":
             whole_name = " ".join(
@@ -831,7 +1435,7 @@ class LoaderUNXML(LoaderXML):
 
         # Main Name Original Script
         
-        name_original_script = self.lxmlFindText(listEntry, "NAME_ORIGINAL_SCRIPT", self.ns)
+        name_original_script = listEntry.childText("NAME_ORIGINAL_SCRIPT")
         if len(name_original_script) > 0:
             names.append(
                 {
@@ -844,16 +1448,16 @@ class LoaderUNXML(LoaderXML):
 
         # Aliases
 
-        if self.listEntryPath == ".//INDIVIDUALS/INDIVIDUAL":
+        if listEntry.path == "INDIVIDUALS/INDIVIDUAL":
             aliasesPath = "INDIVIDUAL_ALIAS"
         else:
             aliasesPath = "ENTITY_ALIAS"
 
-        for alias in listEntry.findall(aliasesPath, namespaces=self.ns):            
-            aliasName = self.lxmlFindText(alias, "ALIAS_NAME", self.ns)
+        for alias in listEntry.fields(aliasesPath):            
+            aliasName = alias.childText("ALIAS_NAME")
             aliasName = self.stripAdvance(aliasName)
             if len(aliasName) > 0:
-                quality = self.lxmlFindText(alias, "QUALITY", self.ns)
+                quality = alias.childText("QUALITY")
                 strong = False if quality == "Low" else True                
                 names.append(
                     {
@@ -870,17 +1474,17 @@ class LoaderUNXML(LoaderXML):
 
         addresses = []
 
-        if self.listEntryPath == ".//INDIVIDUALS/INDIVIDUAL":
+        if listEntry.path == "INDIVIDUALS/INDIVIDUAL":
             addressesPath = "INDIVIDUAL_ADDRESS"
         else:
             addressesPath = "ENTITY_ADDRESS"
 
-        for address in listEntry.findall(addressesPath, namespaces = self.ns):
-            street = self.lxmlFindText(address, "STREET", self.ns)
-            city = self.lxmlFindText(address, "CITY", self.ns)
-            country_subdivision = self.lxmlFindText(address, "STATE_PROVINCE", self.ns)
-            country_ori =  self.lxmlFindText(address, "COUNTRY", self.ns)
-            country_ori = self.stripAdvance(country_ori).upper()
+        for address in listEntry.fields(addressesPath):
+            street = address.childText("STREET")
+            city = address.childText("CITY")
+            country_subdivision = address.childText("STATE_PROVINCE")
+            country_ori =  address.childText("COUNTRY")
+            country_ori = self.normalizeUpperText(country_ori)
             address = " ".join(
                 [
                     street,
@@ -891,8 +1495,7 @@ class LoaderUNXML(LoaderXML):
             )
             address = self.stripAdvance(address)
             if len(address) > 0:
-                country_ISO_code = self.getISOCodeFromCountryName(country_ori)
-                country_desc = self.getCountryNameFromISOCode(country_ISO_code)
+                country_ISO_code, country_desc = self.resolveCountry(country_ori)
                 addresses.append(
                     {
                         "address": address.upper(),
@@ -910,16 +1513,15 @@ class LoaderUNXML(LoaderXML):
 
         nationalities = []
 
-        if self.listEntryPath == ".//INDIVIDUALS/INDIVIDUAL":
-            for nationalityEl in listEntry.findall("NATIONALITY/VALUE", namespaces = self.ns):
+        if listEntry.path == "INDIVIDUALS/INDIVIDUAL":
+            for nationalityEl in listEntry.subElements("NATIONALITY", "VALUE"):
                 if nationalityEl.text is not None:
                     nationality_ori = nationalityEl.text 
-                    nationality_ori = self.stripAdvance(nationality_ori).upper()
+                    nationality_ori = self.normalizeUpperText(nationality_ori)
                 else:
                     nationality_ori = ""
                 if len(nationality_ori) > 0:
-                    country_ISO_code = self.getISOCodeFromCountryName(nationality_ori)
-                    country_desc = self.getCountryNameFromISOCode(country_ISO_code)
+                    country_ISO_code, country_desc = self.resolveCountry(nationality_ori)
                     nationalities.append(
                          {
                             "country_ori": nationality_ori,
@@ -934,11 +1536,11 @@ class LoaderUNXML(LoaderXML):
 
         datesOfBirth = []
 
-        if self.listEntryPath == ".//INDIVIDUALS/INDIVIDUAL":
-            for dobEl in listEntry.findall("INDIVIDUAL_DATE_OF_BIRTH", namespaces = self.ns):
+        if listEntry.path == "INDIVIDUALS/INDIVIDUAL":
+            for dobFields in listEntry.fields("INDIVIDUAL_DATE_OF_BIRTH"):
 
-                yearIni = self.lxmlFindText(dobEl, "FROM_YEAR", self.ns)
-                yearEnd = self.lxmlFindText(dobEl, "TO_YEAR", self.ns)
+                yearIni = dobFields.childText("FROM_YEAR")
+                yearEnd = dobFields.childText("TO_YEAR")
 
                 if len(yearIni) > 0 and len(yearEnd) > 0:
 
@@ -954,7 +1556,7 @@ class LoaderUNXML(LoaderXML):
 
                 else:
 
-                    date_of_birth = self.lxmlFindText(dobEl, "DATE", self.ns)
+                    date_of_birth = dobFields.childText("DATE")
                     if len(date_of_birth) > 0:
                         date_of_birthParts = date_of_birth.split("-")
                         day = date_of_birthParts[2]
@@ -963,7 +1565,7 @@ class LoaderUNXML(LoaderXML):
                     else:
                         day = ""
                         month = ""
-                        year = self.lxmlFindText(dobEl, "YEAR", self.ns)
+                        year = dobFields.childText("YEAR")
                     if len(date_of_birth) > 0 or \
                        len(day) > 0 or \
                        len(month) > 0 or \
@@ -983,15 +1585,15 @@ class LoaderUNXML(LoaderXML):
 
         placesOfBirth = []
 
-        if self.listEntryPath == ".//INDIVIDUALS/INDIVIDUAL":
+        if listEntry.path == "INDIVIDUALS/INDIVIDUAL":
 
-            for pobEl in listEntry.findall("INDIVIDUAL_PLACE_OF_BIRTH", namespaces = self.ns):
+            for pobFields in listEntry.fields("INDIVIDUAL_PLACE_OF_BIRTH"):
 
-                street = self.lxmlFindText(pobEl, "STREET", self.ns)
-                city = self.lxmlFindText(pobEl, "CITY", self.ns)
-                country_subdivision = self.lxmlFindText(pobEl, "STATE_PROVINCE", self.ns)
-                country_ori = self.lxmlFindText(pobEl, "COUNTRY", self.ns)
-                country_ori = self.stripAdvance(country_ori).upper()
+                street = pobFields.childText("STREET")
+                city = pobFields.childText("CITY")
+                country_subdivision = pobFields.childText("STATE_PROVINCE")
+                country_ori = pobFields.childText("COUNTRY")
+                country_ori = self.normalizeUpperText(country_ori)
                 pob = " ".join(
                     [
                         street,
@@ -1002,8 +1604,7 @@ class LoaderUNXML(LoaderXML):
                 )               
                 pob = self.stripAdvance(pob)
                 if len(pob) > 0:
-                    country_ISO_code = self.getISOCodeFromCountryName(country_ori)
-                    country_desc = self.getCountryNameFromISOCode(country_ISO_code)
+                    country_ISO_code, country_desc = self.resolveCountry(country_ori)
                     placesOfBirth.append(
                         {
                             "place_of_birth": pob.upper(),
@@ -1022,16 +1623,16 @@ class LoaderUNXML(LoaderXML):
 
         identifications = []
 
-        if self.listEntryPath == ".//INDIVIDUALS/INDIVIDUAL":
+        if listEntry.path == "INDIVIDUALS/INDIVIDUAL":
 
-            for IdEl in listEntry.findall("INDIVIDUAL_DOCUMENT", namespaces = self.ns):
-                idNumber = self.lxmlFindText(IdEl, "NUMBER", self.ns)
+            for idFields in listEntry.fields("INDIVIDUAL_DOCUMENT"):
+                idNumber = idFields.childText("NUMBER")
                 if len(idNumber) > 0:
-                    idType = self.lxmlFindText(IdEl, "TYPE_OF_DOCUMENT", self.ns)
-                    country1 = self.lxmlFindText(IdEl, "COUNTRY_OF_ISSUE", self.ns)
-                    country1 = self.stripAdvance(country1).upper()
-                    country2 = self.lxmlFindText(IdEl, "ISSUING_COUNTRY", self.ns)
-                    country2 = self.stripAdvance(country2).upper()
+                    idType = idFields.childText("TYPE_OF_DOCUMENT")
+                    country1 = idFields.childText("COUNTRY_OF_ISSUE")
+                    country1 = self.normalizeUpperText(country1)
+                    country2 = idFields.childText("ISSUING_COUNTRY")
+                    country2 = self.normalizeUpperText(country2)
                     if country1 == country2:
                         country_ori = country1
                     else:
@@ -1039,11 +1640,10 @@ class LoaderUNXML(LoaderXML):
                             country_ori = country1
                         else:
                             country_ori = country2
-                    country_ISO_code = self.getISOCodeFromCountryName(country_ori)
-                    country_desc = self.getCountryNameFromISOCode(country_ISO_code)
+                    country_ISO_code, country_desc = self.resolveCountry(country_ori)
                     identifications.append(
                         {
-                            "type": self.stripAdvance(idType).upper(),
+                            "type": self.normalizeUpperText(idType),
                             "id": idNumber,
                             "country_ori": country_ori,
                             "country_ISO_code": country_ISO_code,
@@ -1055,8 +1655,8 @@ class LoaderUNXML(LoaderXML):
     
     def getPrograms(self, listEntry):
 
-        listType = self.lxmlFindText(listEntry, "UN_LIST_TYPE", ns=self.ns)
-        listType = self.stripAdvance(listType)        
+        listType = listEntry.childText("UN_LIST_TYPE")
+        listType = self.normalizeText(listType)
         
         if len(listType) > 0:
             return [listType]
@@ -1067,8 +1667,8 @@ class LoaderUNXML(LoaderXML):
 
         result = {}
         
-        remarks = [self.lxmlFindText(listEntry, "COMMENTS1", ns=self.ns)]
-        for designationEl in listEntry.findall("DESIGNATION/VALUE", namespaces=self.ns):
+        remarks = [listEntry.childText("COMMENTS1")]
+        for designationEl in listEntry.subElements("DESIGNATION", "VALUE"):
             if designationEl.text is not None:
                 remarks.append(designationEl.text)
 
@@ -1078,12 +1678,111 @@ class LoaderUNXML(LoaderXML):
         if len(remark) > 0:
             result["remarks"] = remark
 
-        gender = self.lxmlFindText(listEntry, "GENDER", ns=self.ns)
+        gender = listEntry.childText("GENDER")
         gender = self.stripAdvance(gender)
         if len(gender) > 0:                     
             result["gender"] = gender
         
         return result
     
+class LoaderJSON(Loader):
+
+    # Reads back the dumps of DumperJSON. The list entries are already
+    # normalized, so they are returned as they are read.
+
+    def __init__(self, 
+                 description="", 
+                 backend="json", 
+                 records=False, 
+                 store=False
+        ):
+        super().__init__(
+            description=description, 
+            backend=backend, 
+            records=records, 
+            store=store
+        )
+        self.backend = getJSONBackend(backend)
+
+    def load(self, data_source):
+        return self.loadResult(data_source, self.newContext())
+
+    def loadListEntries(self, data_source, context):
+        data = self.backend.loads(self.readSource(data_source))
+        if isinstance(data, list):
+            # Dump of the list entries only.
+            listEntries = data
+        else:
+            context.meta.update(data.get("meta", {}))
+            listEntries = data["list_entries"]
+        if len(self.meta["description"]) > 0:
+            context.meta["description"] = self.meta["description"]
+        return iter(listEntries)
+
+    @staticmethod
+    def readSource(data_source):
+        # The whole document is read at once: the backends parse it in one
+        # call. Files and file objects can be compressed.
+        if isinstance(data_source, (bytes, bytearray)):
+            return data_source
+        elif isinstance(data_source, Path) or \
+             (isinstance(data_source, str) and os.path.exists(data_source)):
+            source = openPath(str(data_source))
+            if isinstance(source, str):
+                with open(source, mode="rb") as f:
+                    return f.read()
+            with source:
+                return source.read()
+        elif isinstance(data_source, str):
+            return data_source
+        elif hasattr(data_source, "read"):
+            if isinstance(data_source, TextIOBase):
+                return data_source.read()
+            return openDecompressed(data_source).read()
+        else:
+            raise Exception("Data source not allowed")
+
+def _loadListEntriesChunk(loaderClass, loaderKwargs, ns, chunk):
+    loader = loaderClass(**loaderKwargs)
+    context = loader.newContext()
+    context.ns = ns
+    listEntries = []
+    for listEntryPath, listEntryXML in chunk:
+        listEntries.append(
+            loader.loadListEntry((listEntryPath, ET.fromstring(listEntryXML)), context)
+        )
+    return listEntries
+
 def load(data, loader=Loader, *args, **kwargs):
-    return loader(*args, **kwargs).load(data)
\ No newline at end of file
+    return loader(*args, **kwargs).load(data)
+
+def iter_load(data, loader=Loader, *args, chunksize=None, **kwargs):
+    return loader(*args, **kwargs).iterListEntries(data, chunksize=chunksize)
+
+def _loadTimed(data, loader, kwargs):
+    start = time.perf_counter()
+    try:
+        result = {
+            "data": load(data, loader, **kwargs),
+            "error": None
+        }
+    except Exception as err:
+        result = {
+            "data": None,
+            "error": err
+        }
+    result["elapsed"] = time.perf_counter() - start
+    return result
+
+def load_many(sources, max_workers=None):
+    # Every source is loaded by its own loader instance in a thread.
+    # Downloads and lxml parsing release the GIL, so the sources overlap.
+    if max_workers is None:
+        max_workers = max(len(sources), 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for name, sourceInfo in sources.items():
+            data, loader = sourceInfo[0], sourceInfo[1]
+            kwargs = sourceInfo[2] if len(sourceInfo) > 2 else {}
+            futures[name] = executor.submit(_loadTimed, data, loader, kwargs)
+        return {name: future.result() for name, future in futures.items()}
\ No newline at end of file
@@ -0,0 +1,177 @@
+__all__ = [
+    "Record",
+    "ListEntry",
+    "Name",
+    "Address",
+    "Nationality",
+    "DateOfBirth",
+    "PlaceOfBirth",
+    "Identification",
+    "toDict"
+]
+
+class Record():
+
+    # Compact alternative to the dictionaries of the common interface.
+    # The slots are declared in the same order as the dictionary keys.
+
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs):
+        for slot, value in zip(self.__slots__, args):
+            setattr(self, slot, value)
+        for slot in self.__slots__[len(args):]:
+            setattr(self, slot, kwargs.get(slot, ""))
+
+    def to_dict(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(*[data.get(slot, "") for slot in cls.__slots__])
+
+    def values(self):
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.values() == other.values()
+
+    def __hash__(self):
+        return hash((type(self), self.values()))
+
+    def __repr__(self):
+        values = ", ".join(
+            f"{slot}={getattr(self, slot)!r}" for slot in self.__slots__
+        )
+        return f"{type(self).__name__}({values})"
+
+    def __getstate__(self):
+        return self.values()
+
+    def __setstate__(self, state):
+        for slot, value in zip(self.__slots__, state):
+            setattr(self, slot, value)
+
+class Name(Record):
+
+    __slots__ = ("whole_name", "strong", "first_name", "last_name")
+
+class Address(Record):
+
+    __slots__ = (
+        "address",
+        "street",
+        "city",
+        "country_subdivision",
+        "country_ori",
+        "country_ISO_code",
+        "country_desc"
+    )
+
+class Nationality(Record):
+
+    __slots__ = ("country_ori", "country_ISO_code", "country_desc")
+
+class DateOfBirth(Record):
+
+    __slots__ = ("date_of_birth", "year", "month", "day")
+
+class PlaceOfBirth(Record):
+
+    __slots__ = (
+        "place_of_birth",
+        "street",
+        "city",
+        "country_subdivision",
+        "country_ori",
+        "country_ISO_code",
+        "country_desc"
+    )
+
+class Identification(Record):
+
+    __slots__ = ("type", "id", "country_ori", "country_ISO_code", "country_desc")
+
+class ListEntry(Record):
+
+    __slots__ = (
+        "id",
+        "type",
+        "names",
+        "addresses",
+        "nationalities",
+        "dates_of_birth",
+        "places_of_birth",
+        "identifications",
+        "programs",
+        "additional_information"
+    )
+
+    __hash__ = None
+
+    relations = {
+        "names": Name,
+        "addresses": Address,
+        "nationalities": Nationality,
+        "dates_of_birth": DateOfBirth,
+        "places_of_birth": PlaceOfBirth,
+        "identifications": Identification
+    }
+
+    def __init__(self,
+                 id="",
+                 type="",
+                 names=(),
+                 addresses=(),
+                 nationalities=(),
+                 dates_of_birth=(),
+                 places_of_birth=(),
+                 identifications=(),
+                 programs=(),
+                 additional_information=None
+        ):
+        self.id = id
+        self.type = type
+        self.names = tuple(names)
+        self.addresses = tuple(addresses)
+        self.nationalities = tuple(nationalities)
+        self.dates_of_birth = tuple(dates_of_birth)
+        self.places_of_birth = tuple(places_of_birth)
+        self.identifications = tuple(identifications)
+        self.programs = tuple(programs)
+        self.additional_information = additional_information
+
+    def to_dict(self):
+        # Same layout as the loaders: the optional fields are only present
+        # when they have values.
+        result = {
+            "id": self.id,
+            "type": self.type,
+            "names": [name.to_dict() for name in self.names]
+        }
+        for relation in list(self.relations)[1:]:
+            records = getattr(self, relation)
+            if len(records) > 0:
+                result[relation] = [record.to_dict() for record in records]
+        if len(self.programs) > 0:
+            result["programs"] = list(self.programs)
+        if bool(self.additional_information):
+            result["additional_information"] = dict(self.additional_information)
+        return result
+
+    @classmethod
+    def from_dict(cls, data):
+        kwargs = {
+            relation: [recordClass.from_dict(record) for record in data.get(relation, [])]
+            for relation, recordClass in cls.relations.items()
+        }
+        return cls(
+            id=data.get("id", ""),
+            type=data.get("type", ""),
+            programs=data.get("programs", []),
+            additional_information=data.get("additional_information"),
+            **kwargs
+        )
+
+def toDict(listEntry):
+    return listEntry.to_dict() if hasattr(listEntry, "to_dict") else listEntry
@@ -0,0 +1,103 @@
+from pathlib import Path
+import hashlib
+import os
+import pickle
+import threading
+
+__all__ = [
+    "SnapshotCache"
+]
+
+class SnapshotCache():
+
+    # On disk cache of the results of the loaders. Every snapshot is a
+    # pickle (protocol 5) file named by its key. The least recently used
+    # snapshots are removed when the total size is over max_size bytes.
+
+    def __init__(self, cache_dir, max_size=1024 * 1024 * 1024):
+        self.cacheDir = Path(cache_dir).expanduser()
+        self.cacheDir.mkdir(parents=True, exist_ok=True)
+        self.maxSize = max_size
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def getPath(self, key):
+        return Path(self.cacheDir, f"{key}.pickle")
+
+    def get(self, key):
+        path = self.getPath(key)
+        try:
+            with open(path, mode="rb") as f:
+                result = pickle.load(f)
+            # The modification time is the last use of the snapshot.
+            os.utime(path)
+        except Exception:
+            # Unreadable or stale snapshots (for instance of a renamed
+            # class) are misses.
+            with self.lock:
+                self.misses += 1
+            return None
+        with self.lock:
+            self.hits += 1
+        return result
+
+    def put(self, key, result):
+        path = self.getPath(key)
+        tmpPath = Path(f"{path}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmpPath, mode="wb") as f:
+                pickle.dump(result, f, protocol=5)
+            os.replace(tmpPath, path)
+        finally:
+            tmpPath.unlink(missing_ok=True)
+        self.evict()
+
+    def evict(self):
+        snapshots = []
+        for path in self.cacheDir.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshots.append((stat.st_mtime_ns, stat.st_size, path))
+        snapshots.sort()
+        size = sum(snapshot[1] for snapshot in snapshots)
+        # The most recent snapshot is kept even if it is over max_size.
+        for _, snapshotSize, path in snapshots[:-1]:
+            if size <= self.maxSize:
+                break
+            path.unlink(missing_ok=True)
+            size -= snapshotSize
+
+    def clear(self):
+        for path in self.cacheDir.glob("*.pickle"):
+            path.unlink(missing_ok=True)
+        with self.lock:
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        paths = list(self.cacheDir.glob("*.pickle"))
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(paths),
+                "bytes": sum(path.stat().st_size for path in paths)
+            }
+
+    @staticmethod
+    def getKey(sourceDigest, loader, schema=None, options=None):
+        # The key changes with the content of the source, the loader class
+        # and its version, the content of the schema and the options that
+        # change the result of the loader.
+        key = hashlib.sha256()
+        key.update(sourceDigest.encode("utf-8"))
+        key.update(f"{type(loader).__module__}.{type(loader).__qualname__}".encode("utf-8"))
+        key.update(str(loader.version).encode("utf-8"))
+        if schema is not None:
+            with open(schema, mode="rb") as f:
+                key.update(hashlib.sha256(f.read()).digest())
+        key.update(repr(sorted((options or {}).items())).encode("utf-8"))
+        return key.hexdigest()
@@ -0,0 +1,263 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pathlib import Path
+import hashlib
+import io
+import json
+import os
+import threading
+import gzip
+import bz2
+import lzma
+import zipfile
+import shutil
+import tempfile
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+__all__ = [
+    "HTTPClient"
+]
+
+_compressionMagics = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+    "zstd": b"\x28\xb5\x2f\xfd",
+    "zip": b"PK\x03\x04"
+}
+
+class HTTPClient():
+
+    def __init__(self,
+                 cache_dir=None,
+                 timeout=(10, 300),
+                 retries=3,
+                 backoff_factor=0.5,
+                 pool_maxsize=10
+        ):
+        self.cacheDir = None if cache_dir is None else Path(cache_dir).expanduser()
+        if self.cacheDir is not None:
+            self.cacheDir.mkdir(parents=True, exist_ok=True)
+        self.timeout = timeout
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET", "HEAD")
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, url):
+        with self.open(url) as f:
+            return f.read()
+
+    def open(self, url):
+        bodyPath, metaPath = self.getCachePaths(url)
+        headers = self.getConditionalHeaders(bodyPath, metaPath)
+        r = self.session.get(url, headers=headers, timeout=self.timeout, stream=True)
+        if r.status_code == 304:
+            r.close()
+            try:
+                cached = open(bodyPath, mode="rb")
+            except (OSError, TypeError):
+                cached = None
+            if cached is not None:
+                with self.lock:
+                    self.hits += 1
+                return cached
+            # The cached body is gone (removed after the conditional
+            # headers were built): the entry is dropped and the url is
+            # requested again without conditions.
+            self.dropCache(bodyPath, metaPath)
+            r = self.session.get(url, timeout=self.timeout, stream=True)
+            if r.status_code == 304:
+                r.close()
+                raise Exception(f"Not modified response without a cached body: {url}")
+        try:
+            r.raise_for_status()
+        except Exception:
+            r.close()
+            raise
+        with self.lock:
+            self.misses += 1
+        meta = {
+            "etag": r.headers.get("ETag", ""),
+            "last_modified": r.headers.get("Last-Modified", "")
+        }
+        if bodyPath is None or (not meta["etag"] and not meta["last_modified"]):
+            return io.BufferedReader(_ResponseStream(r))
+        return io.BufferedReader(_ResponseStream(r, bodyPath, metaPath, meta))
+
+    def getCachePaths(self, url):
+        if self.cacheDir is None:
+            return None, None
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return Path(self.cacheDir, f"{key}.body"), Path(self.cacheDir, f"{key}.json")
+
+    @staticmethod
+    def dropCache(bodyPath, metaPath):
+        for path in [bodyPath, metaPath]:
+            if path is not None:
+                path.unlink(missing_ok=True)
+
+    @staticmethod
+    def getConditionalHeaders(bodyPath, metaPath):
+        headers = {}
+        if bodyPath is None or not bodyPath.exists() or not metaPath.exists():
+            return headers
+        try:
+            with open(metaPath, mode="r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return headers
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def info(self):
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+def getCompressionFormat(magic):
+    for compressionFormat, compressionMagic in _compressionMagics.items():
+        if magic.startswith(compressionMagic):
+            return compressionFormat
+    return None
+
+def openDecompressed(stream):
+    # The compression format is detected from the first bytes of the
+    # stream, whatever the name of the file or the url.
+    if not hasattr(stream, "peek"):
+        stream = io.BufferedReader(stream)
+    compressionFormat = getCompressionFormat(stream.peek(6)[:6])
+    if compressionFormat is None:
+        return stream
+    elif compressionFormat == "gzip":
+        return _ChainedStream(gzip.GzipFile(fileobj=stream, mode="rb"), [stream])
+    elif compressionFormat == "bz2":
+        return _ChainedStream(bz2.BZ2File(stream, mode="rb"), [stream])
+    elif compressionFormat == "xz":
+        return _ChainedStream(lzma.LZMAFile(stream, mode="rb"), [stream])
+    elif compressionFormat == "zstd":
+        if zstandard is None:
+            stream.close()
+            raise Exception("zstd compression requires zstandard: pip install inoutlists[zstd]")
+        return _ChainedStream(zstandard.ZstdDecompressor().stream_reader(stream), [stream])
+    else:
+        # Zip archives need random access: a network stream is spooled,
+        # still compressed, before the member is decompressed.
+        if not stream.seekable():
+            spool = tempfile.SpooledTemporaryFile(max_size=64 * 1024 * 1024)
+            shutil.copyfileobj(stream, spool)
+            stream.close()
+            spool.seek(0)
+            stream = spool
+        archive = zipfile.ZipFile(stream)
+        members = [name for name in archive.namelist() if not name.endswith("/")]
+        if len(members) == 0:
+            archive.close()
+            stream.close()
+            raise Exception("The zip archive is empty")
+        xmlMembers = [name for name in members if name.lower().endswith(".xml")]
+        member = archive.open(xmlMembers[0] if len(xmlMembers) > 0 else members[0])
+        return _ChainedStream(member, [archive, stream])
+
+def openPath(path):
+    with open(path, mode="rb") as f:
+        compressionFormat = getCompressionFormat(f.read(6))
+    if compressionFormat is None:
+        return path
+    return openDecompressed(open(path, mode="rb"))
+
+class _ChainedStream(io.RawIOBase):
+
+    # Decompressed view of a stream that also closes the underlying objects.
+
+    def __init__(self, stream, closing):
+        self.stream = stream
+        self.closing = closing
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self.stream.readinto(b)
+
+    def close(self):
+        if not self.closed:
+            self.stream.close()
+            for closing in self.closing:
+                closing.close()
+        super().close()
+
+class _ResponseStream(io.RawIOBase):
+
+    # Reads the body of a streamed response as it arrives from the network.
+    # If a cache path is given, the body is copied to a temporary file that
+    # replaces the cached one only when the whole body has been read, so
+    # concurrent readers never see a partial body.
+
+    def __init__(self, response, bodyPath=None, metaPath=None, meta=None):
+        self.response = response
+        self.response.raw.decode_content = True
+        self.bodyPath = bodyPath
+        self.metaPath = metaPath
+        self.meta = meta
+        self.cacheFile = None
+        if bodyPath is not None:
+            suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+            self.bodyTmp = Path(f"{bodyPath}{suffix}")
+            self.metaTmp = Path(f"{metaPath}{suffix}")
+            self.cacheFile = open(self.bodyTmp, mode="wb")
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        data = self.response.raw.read(len(b))
+        if len(data) == 0:
+            self.commitCache()
+            return 0
+        if self.cacheFile is not None:
+            self.cacheFile.write(data)
+        b[:len(data)] = data
+        return len(data)
+
+    def commitCache(self):
+        if self.cacheFile is None:
+            return
+        self.cacheFile.close()
+        self.cacheFile = None
+        with open(self.metaTmp, mode="w", encoding="utf-8") as f:
+            json.dump(self.meta, f)
+        os.replace(self.bodyTmp, self.bodyPath)
+        os.replace(self.metaTmp, self.metaPath)
+
+    def close(self):
+        if self.cacheFile is not None:
+            self.cacheFile.close()
+            self.cacheFile = None
+            self.bodyTmp.unlink(missing_ok=True)
+        self.response.close()
+        super().close()
+
+defaultHTTPClient = HTTPClient()
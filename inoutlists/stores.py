@@ -0,0 +1,203 @@
+from array import array
+from collections.abc import Mapping
+import numpy as np
+import pandas as pd
+from .records import ListEntry, Record
+
+__all__ = [
+    "ListStore",
+    "ListStoreEntry"
+]
+
+class ListStore():
+
+    # Columnar (struct of arrays) container of list entries. Every field of
+    # the common interface is kept in its own column. The one to many
+    # relations keep their rows in parallel columns plus an offsets array:
+    # the rows of the entry i are the rows offsets[i]:offsets[i + 1].
+    # offsets and column return copies of the numeric columns, or zero copy
+    # views once the store is frozen (freeze), as an array cannot grow while
+    # a view of it exists. The string columns are always copied into arrays
+    # of objects.
+
+    relations = {
+        relation: recordClass.__slots__
+        for relation, recordClass in ListEntry.relations.items()
+    }
+    boolFields = {"strong"}
+    frozen = False
+
+    def __init__(self, meta=None):
+        self.meta = {} if meta is None else meta
+        self.ids = []
+        self.types = []
+        self.additionalInformation = []
+        self.relationColumns = {
+            relation: {
+                field: array("b") if field in self.boolFields else []
+                for field in fields
+            }
+            for relation, fields in self.relations.items()
+        }
+        self.relationOffsets = {
+            relation: array("q", [0]) for relation in list(self.relations) + ["programs"]
+        }
+        self.programs = []
+
+    def append(self, listEntry):
+        if self.frozen:
+            raise Exception("The ListStore is frozen")
+        if isinstance(listEntry, Record):
+            listEntry = listEntry.to_dict()
+        self.ids.append(listEntry["id"])
+        self.types.append(listEntry["type"])
+        for relation, fields in self.relations.items():
+            columns = self.relationColumns[relation]
+            rows = listEntry.get(relation, [])
+            for row in rows:
+                for field in fields:
+                    columns[field].append(row.get(field, ""))
+            offsets = self.relationOffsets[relation]
+            offsets.append(offsets[-1] + len(rows))
+        programs = listEntry.get("programs", [])
+        self.programs.extend(programs)
+        offsets = self.relationOffsets["programs"]
+        offsets.append(offsets[-1] + len(programs))
+        additionalInformation = listEntry.get("additional_information")
+        self.additionalInformation.append(
+            additionalInformation if bool(additionalInformation) else None
+        )
+
+    def extend(self, listEntries):
+        for listEntry in listEntries:
+            self.append(listEntry)
+
+    def freeze(self):
+        # No more list entries can be appended.
+        self.frozen = True
+        return self
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("ListStore index out of range")
+        return ListStoreEntry(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield ListStoreEntry(self, index)
+
+    def rowRange(self, relation, index):
+        offsets = self.relationOffsets[relation]
+        return offsets[index], offsets[index + 1]
+
+    def offsets(self, relation):
+        offsets = np.frombuffer(self.relationOffsets[relation], dtype=np.int64)
+        return offsets if self.frozen else offsets.copy()
+
+    def entryIndex(self, relation):
+        return np.repeat(
+            np.arange(len(self), dtype=np.int64),
+            np.diff(self.offsets(relation))
+        )
+
+    def column(self, relation, field=None):
+        if relation == "id":
+            return np.array(self.ids, dtype=object)
+        elif relation == "type":
+            return np.array(self.types, dtype=object)
+        elif relation == "programs":
+            return np.array(self.programs, dtype=object)
+        column = self.relationColumns[relation][field]
+        if isinstance(column, array):
+            flags = np.frombuffer(column, dtype=np.bool_)
+            return flags if self.frozen else flags.copy()
+        return np.array(column, dtype=object)
+
+    def toDataFrame(self, relation=None):
+        if relation is None:
+            return pd.DataFrame(
+                {
+                    "id": self.column("id"),
+                    "type": self.column("type")
+                }
+            )
+        entryIndex = self.entryIndex(relation)
+        columns = {
+            "id": self.column("id")[entryIndex],
+            "type": self.column("type")[entryIndex]
+        }
+        if relation == "programs":
+            columns["programs"] = self.column("programs")
+        else:
+            for field in self.relations[relation]:
+                columns[f"{relation}_{field}"] = self.column(relation, field)
+        return pd.DataFrame(columns)
+
+    def to_list(self):
+        return [listEntry.to_dict() for listEntry in self]
+
+class ListStoreEntry(Mapping):
+
+    # Read only dictionary view of one entry of a ListStore, with the same
+    # keys as the dictionaries returned by the loaders.
+
+    __slots__ = ("store", "index")
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    def keys(self):
+        keys = ["id", "type", "names"]
+        for relation in list(self.store.relations)[1:] + ["programs"]:
+            start, end = self.store.rowRange(relation, self.index)
+            if end > start:
+                keys.append(relation)
+        if self.store.additionalInformation[self.index] is not None:
+            keys.append("additional_information")
+        return keys
+
+    def __getitem__(self, key):
+        if key == "id":
+            return self.store.ids[self.index]
+        elif key == "type":
+            return self.store.types[self.index]
+        elif key == "programs":
+            start, end = self.store.rowRange("programs", self.index)
+            if end == start:
+                raise KeyError(key)
+            return self.store.programs[start:end]
+        elif key == "additional_information":
+            additionalInformation = self.store.additionalInformation[self.index]
+            if additionalInformation is None:
+                raise KeyError(key)
+            return additionalInformation
+        elif key in self.store.relations:
+            start, end = self.store.rowRange(key, self.index)
+            if key != "names" and end == start:
+                raise KeyError(key)
+            columns = self.store.relationColumns[key]
+            fields = self.store.relations[key]
+            return [
+                {
+                    field: bool(columns[field][row]) if field in self.store.boolFields
+                    else columns[field][row]
+                    for field in fields
+                }
+                for row in range(start, end)
+            ]
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def to_dict(self):
+        return {key: self[key] for key in self.keys()}
@@ -0,0 +1,54 @@
+import unittest
+from pathlib import Path
+import os
+import copy
+from inoutlists import load, diff, fingerprint, LoaderUNXML
+
+class TestDiff(unittest.TestCase):
+
+    def setUp(self):
+        self.fixturesPath = Path(
+            Path(os.path.realpath(__file__)).parent.parent,
+            Path("./integration/fixtures")
+        )
+        self.old = load(Path(self.fixturesPath, "un_consolidated.xml"), LoaderUNXML)
+
+    def test_same_list(self):
+        new = load(
+            Path(self.fixturesPath, "un_consolidated.xml"),
+            LoaderUNXML,
+            records=True
+        )
+        result = diff(self.old, new)
+        self.assertEqual(result["added"], [])
+        self.assertEqual(result["removed"], [])
+        self.assertEqual(result["changed"], [])
+        self.assertEqual(result["unchanged"], len(self.old["list_entries"]))
+
+    def test_added_removed_changed(self):
+        new = copy.deepcopy(self.old)
+        removed = new["list_entries"].pop(0)
+        added = dict(new["list_entries"][0], id="NEW.001")
+        new["list_entries"].append(added)
+        new["list_entries"][1]["programs"] = ["OTHER"]
+        new["list_entries"][1]["names"][0]["whole_name"] = "CHANGED"
+        result = diff(self.old, new)
+        self.assertEqual(result["added"], [added])
+        self.assertEqual(result["removed"], [removed])
+        self.assertEqual(len(result["changed"]), 1)
+        self.assertEqual(result["changed"][0]["id"], new["list_entries"][1]["id"])
+        self.assertEqual(result["changed"][0]["fields"], ["names", "programs"])
+        self.assertEqual(result["unchanged"], len(self.old["list_entries"]) - 2)
+
+    def test_fingerprint(self):
+        listEntry = self.old["list_entries"][0]
+        reordered = dict(reversed(list(listEntry.items())))
+        self.assertEqual(fingerprint(listEntry), fingerprint(reordered))
+        self.assertNotEqual(fingerprint(listEntry), fingerprint(dict(listEntry, type="U")))
+
+    def test_duplicated_ids(self):
+        listEntries = self.old["list_entries"]
+        self.assertRaises(Exception, diff, listEntries, listEntries + listEntries[:1])
+
+if __name__ == '__main__':
+    unittest.main()
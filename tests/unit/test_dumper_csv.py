@@ -0,0 +1,95 @@
+import unittest
+from pathlib import Path
+import os
+import io
+import csv
+import gzip
+import tempfile
+import pandas as pd
+from inoutlists import load, iter_load, dump, LoaderOFACXML, DumperCSV
+
+class TestDumperCSV(unittest.TestCase):
+
+    def setUp(self):
+        self.fixturesPath = Path(
+            Path(os.path.realpath(__file__)).parent.parent,
+            Path("./integration/fixtures")
+        )
+        self.localPath = Path(self.fixturesPath, "consolidated.xml")
+        self.data = load(self.localPath, LoaderOFACXML)
+
+    def test_streaming_same_rows(self):
+        df = pd.read_csv(
+            io.StringIO(dump(self.data, DumperCSV, index=False)), 
+            dtype=str, 
+            keep_default_na=False
+        )
+        dfStreaming = pd.read_csv(
+            io.StringIO(dump(self.data, DumperCSV, streaming=True, index=False)), 
+            dtype=str, 
+            keep_default_na=False
+        )
+        self.assertEqual(list(dfStreaming.columns), list(df.columns))
+        self.assertTrue(
+            df.sort_values(list(df.columns)).reset_index(drop=True).equals(
+                dfStreaming.sort_values(list(df.columns)).reset_index(drop=True)
+            )
+        )
+
+    def test_streaming_index(self):
+        rows = list(csv.reader(io.StringIO(dump(self.data, DumperCSV))))
+        rowsStreaming = list(csv.reader(io.StringIO(dump(self.data, DumperCSV, streaming=True))))
+        self.assertEqual(rowsStreaming[0], rows[0])
+        self.assertEqual(len(rowsStreaming), len(rows))
+        self.assertEqual(
+            [row[0] for row in rowsStreaming[1:]], 
+            [str(i) for i in range(len(rows) - 1)]
+        )
+        with self.assertRaises(Exception):
+            dump(self.data, DumperCSV, streaming=True, na_rep="NULL")
+
+    def test_streaming_false(self):
+        content = dump(self.data, DumperCSV, index=False)
+        self.assertEqual(dump(self.data, DumperCSV, streaming=False, index=False), content)
+        with tempfile.TemporaryDirectory() as outputDir:
+            output = Path(outputDir, "ofac.csv")
+            self.assertTrue(
+                dump(self.data, DumperCSV, output=output, streaming=False, index=False)
+            )
+            with open(output, encoding="utf-8", newline="") as f:
+                self.assertEqual(f.read(), content)
+
+    def test_streaming_binary_file_object(self):
+        output = io.BytesIO()
+        self.assertTrue(dump(self.data, DumperCSV, streaming=True, output=output))
+        self.assertEqual(
+            output.getvalue().decode("utf-8"), 
+            dump(self.data, DumperCSV, streaming=True)
+        )
+
+    def test_streaming_parts(self):
+        rows = dump(self.data, DumperCSV, streaming=True).splitlines()
+        with tempfile.TemporaryDirectory() as outputDir:
+            self.assertTrue(
+                dump(
+                    iter_load(self.localPath, LoaderOFACXML, streaming=True, chunksize=100),
+                    DumperCSV,
+                    streaming=True,
+                    output=outputDir,
+                    rows_per_part=1000,
+                    compression="gzip"
+                )
+            )
+            parts = sorted(os.listdir(outputDir))
+            self.assertEqual(parts[0], "part-0000.csv.gz")
+            self.assertEqual(len(parts), (len(rows) - 2) // 1000 + 1)
+            partRows = []
+            for part in parts:
+                with gzip.open(Path(outputDir, part), mode="rt", encoding="utf-8", newline="") as f:
+                    reader = csv.reader(f)
+                    self.assertEqual(next(reader), rows[0].split(","))
+                    partRows += list(reader)
+        self.assertEqual(partRows, list(csv.reader(rows[1:])))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from pathlib import Path
+import os
+import json
+import gzip
+import io
+import tempfile
+from inoutlists import load, iter_load, dump, LoaderUNXML, DumperJSONL
+
+class TestDumperJSONL(unittest.TestCase):
+
+    def setUp(self):
+        self.fixturesPath = Path(
+            Path(os.path.realpath(__file__)).parent.parent,
+            Path("./integration/fixtures")
+        )
+        self.localPath = Path(self.fixturesPath, "un_consolidated.xml")
+        self.data = load(self.localPath, LoaderUNXML)
+
+    def test_string(self):
+        lines = dump(self.data, DumperJSONL).splitlines()
+        self.assertEqual(json.loads(lines[0]), {"meta": self.data["meta"]})
+        self.assertEqual([json.loads(line) for line in lines[1:]], self.data["list_entries"])
+
+    def test_iterator_compressed(self):
+        with tempfile.TemporaryDirectory() as outputDir:
+            output = Path(outputDir, "un.jsonl.gz")
+            self.assertTrue(
+                dump(
+                    iter_load(self.localPath, LoaderUNXML, streaming=True, chunksize=100),
+                    DumperJSONL,
+                    output=output
+                )
+            )
+            with gzip.open(output, mode="rt", encoding="utf-8") as f:
+                listEntries = [json.loads(line) for line in f]
+        self.assertEqual(listEntries, self.data["list_entries"])
+
+    def test_file_objects(self):
+        content = dump(self.data, DumperJSONL)
+        output = io.BytesIO()
+        self.assertTrue(dump(self.data, DumperJSONL, output=output))
+        self.assertFalse(output.closed)
+        self.assertEqual(output.getvalue().decode("utf-8"), content)
+        output = io.BytesIO()
+        self.assertTrue(dump(self.data, DumperJSONL, output=output, compression="gzip"))
+        self.assertEqual(gzip.decompress(output.getvalue()).decode("utf-8"), content)
+        output = io.StringIO()
+        self.assertTrue(dump(self.data, DumperJSONL, output=output))
+        self.assertEqual(output.getvalue(), content)
+
+    def test_sidecar(self):
+        data = load(self.localPath, LoaderUNXML, records=True)
+        with tempfile.TemporaryDirectory() as outputDir:
+            output = Path(outputDir, "un.jsonl")
+            self.assertTrue(dump(data, DumperJSONL, output=output, meta="sidecar"))
+            with open(output, mode="r", encoding="utf-8") as f:
+                listEntries = [json.loads(line) for line in f]
+            with open(f"{output}.meta.json", mode="r", encoding="utf-8") as f:
+                meta = json.load(f)
+        self.assertEqual(listEntries, self.data["list_entries"])
+        self.assertEqual(meta, self.data["meta"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+from pathlib import Path
+import os
+import pandas as pd
+from inoutlists import load, dump, LoaderOFACXML, DumperPandas
+
+class TestDumperPandas(unittest.TestCase):
+
+    def setUp(self):
+        self.fixturesPath = Path(
+            Path(os.path.realpath(__file__)).parent.parent,
+            Path("./integration/fixtures")
+        )
+        self.data = load(Path(self.fixturesPath, "consolidated.xml"), LoaderOFACXML)
+
+    def test_wide_layout(self):
+        name = lambda wholeName: {
+            "whole_name": wholeName, 
+            "strong": True, 
+            "first_name": "", 
+            "last_name": ""
+        }
+        data = {
+            "meta": {},
+            "list_entries": [
+                {"id": "2", "type": "I", "names": [name("A"), name("B")], "programs": ["P1", "P2"]},
+                {"id": "1", "type": "O", "programs": ["P3"]},
+                {"id": "3", "type": "I"}
+            ]
+        }
+        df = dump(data, DumperPandas)
+        self.assertEqual(
+            list(df.columns), 
+            ["id", "type", "names_whole_name", "names_strong", "names_first_name", 
+             "names_last_name", "programs"]
+        )
+        self.assertEqual(list(df["id"]), ["1", "2", "2", "2", "2"])
+        self.assertEqual(list(df["names_whole_name"][1:]), ["A", "A", "B", "B"])
+        self.assertEqual(list(df["programs"]), ["P3", "P1", "P2", "P1", "P2"])
+        self.assertTrue(pd.isna(df["names_whole_name"][0]))
+        self.assertEqual(DumperPandas().estimateRows(data), len(df))
+
+    def test_wide_estimate_rows(self):
+        df = dump(self.data, DumperPandas)
+        self.assertEqual(DumperPandas().estimateRows(self.data), len(df))
+        self.assertRaises(Exception, dump, self.data, DumperPandas, max_rows=len(df) - 1)
+
+    def test_wide_categorical(self):
+        df = dump(self.data, DumperPandas)
+        dfCategorical = dump(self.data, DumperPandas, categorical=True)
+        self.assertIsInstance(dfCategorical["addresses_country_ISO_code"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(dfCategorical["programs"].dtype, pd.CategoricalDtype)
+        self.assertTrue(df.equals(dfCategorical.astype(df.dtypes.to_dict())))
+
+    def test_relational(self):
+        frames = dump(self.data, DumperPandas, relational=True)
+        listEntries = self.data["list_entries"]
+        self.assertEqual(
+            list(frames),
+            [
+                "entries",
+                "names",
+                "addresses",
+                "nationalities",
+                "dates_of_birth",
+                "places_of_birth",
+                "identifications",
+                "programs",
+                "additional_information"
+            ]
+        )
+        self.assertEqual(list(frames["entries"]["id"]), [x["id"] for x in listEntries])
+        for relation in ["names", "addresses", "identifications", "programs"]:
+            with self.subTest(relation=relation):
+                self.assertEqual(
+                    len(frames[relation]),
+                    sum(len(x.get(relation, [])) for x in listEntries)
+                )
+        self.assertEqual(frames["names"]["strong"].dtype, bool)
+        listEntry = next(x for x in listEntries if "identifications" in x)
+        identifications = frames["identifications"][
+            frames["identifications"]["id"] == listEntry["id"]
+        ]
+        self.assertEqual(
+            list(identifications["identification_id"]),
+            [identification["id"] for identification in listEntry["identifications"]]
+        )
+
+    def test_relational_empty(self):
+        frames = dump({"meta": {}, "list_entries": []}, DumperPandas, relational=True)
+        self.assertTrue(all(len(frame) == 0 for frame in frames.values()))
+        self.assertEqual(list(frames["programs"].columns), ["id", "program"])
+
+if __name__ == '__main__':
+    unittest.main()
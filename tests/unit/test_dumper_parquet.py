@@ -0,0 +1,62 @@
+import unittest
+from pathlib import Path
+import os
+import tempfile
+import pandas as pd
+from inoutlists import load, iter_load, dump, LoaderOFACXML, DumperPandas, DumperParquet
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+@unittest.skipIf(pq is None, "pyarrow is not installed")
+class TestDumperParquet(unittest.TestCase):
+
+    def setUp(self):
+        self.fixturesPath = Path(
+            Path(os.path.realpath(__file__)).parent.parent,
+            Path("./integration/fixtures")
+        )
+        self.localPath = Path(self.fixturesPath, "consolidated.xml")
+        self.data = load(self.localPath, LoaderOFACXML)
+
+    def test_wide(self):
+        df = dump(self.data, DumperPandas)
+        with tempfile.TemporaryDirectory() as outputDir:
+            output = Path(outputDir, "ofac.parquet")
+            self.assertTrue(dump(self.data, DumperParquet, output=output))
+            dfParquet = pd.read_parquet(output)
+            metadata = pq.ParquetFile(output).metadata
+        self.assertEqual(list(dfParquet.columns), list(df.columns))
+        self.assertTrue(dfParquet.fillna("").astype(str).equals(df.fillna("").astype(str)))
+        self.assertIn("RLE_DICTIONARY", metadata.row_group(0).column(1).encodings)
+
+    def test_wide_iterator_row_groups(self):
+        with tempfile.TemporaryDirectory() as outputDir:
+            output = Path(outputDir, "ofac.parquet")
+            self.assertTrue(
+                dump(
+                    iter_load(self.localPath, LoaderOFACXML, streaming=True),
+                    DumperParquet,
+                    output=output,
+                    row_group_size=4000
+                )
+            )
+            metadata = pq.ParquetFile(output).metadata
+        self.assertEqual(metadata.num_rows, len(dump(self.data, DumperPandas)))
+        self.assertEqual(metadata.num_row_groups, -(-metadata.num_rows // 4000))
+
+    def test_relational(self):
+        frames = dump(self.data, DumperPandas, relational=True)
+        with tempfile.TemporaryDirectory() as outputDir:
+            self.assertTrue(
+                dump(self.data, DumperParquet, output=outputDir, relational=True)
+            )
+            for relation, frame in frames.items():
+                with self.subTest(relation=relation):
+                    frameParquet = pd.read_parquet(Path(outputDir, f"{relation}.parquet"))
+                    self.assertTrue(frameParquet.astype(str).equals(frame.astype(str)))
+
+if __name__ == '__main__':
+    unittest.main()
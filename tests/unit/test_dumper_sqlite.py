@@ -0,0 +1,98 @@
+import unittest
+from pathlib import Path
+import os
+import sqlite3
+import tempfile
+import pandas as pd
+from inoutlists import load, iter_load, dump, LoaderOFACXML, DumperPandas, DumperSQLite
+
+class TestDumperSQLite(unittest.TestCase):
+
+    def setUp(self):
+        self.fixturesPath = Path(
+            Path(os.path.realpath(__file__)).parent.parent,
+            Path("./integration/fixtures")
+        )
+        self.localPath = Path(self.fixturesPath, "consolidated.xml")
+        self.data = load(self.localPath, LoaderOFACXML)
+
+    def test_tables(self):
+        frames = dump(self.data, DumperPandas, relational=True)
+        with tempfile.TemporaryDirectory() as outputDir:
+            output = Path(outputDir, "ofac.db")
+            self.assertTrue(dump(self.data, DumperSQLite, output=output))
+            connection = sqlite3.connect(output)
+            try:
+                for relation, frame in frames.items():
+                    with self.subTest(relation=relation):
+                        frameSQLite = pd.read_sql(f"SELECT * FROM {relation}", connection)
+                        if "strong" in frameSQLite:
+                            frameSQLite["strong"] = frameSQLite["strong"].astype(bool)
+                        self.assertEqual(list(frameSQLite.columns), list(frame.columns))
+                        self.assertTrue(frameSQLite.astype(str).equals(frame.astype(str)))
+                meta = dict(connection.execute("SELECT key, value FROM meta").fetchall())
+            finally:
+                connection.close()
+        self.assertEqual(meta["description"], self.data["meta"]["description"])
+
+    def test_indexes_and_fts(self):
+        with tempfile.TemporaryDirectory() as outputDir:
+            output = Path(outputDir, "ofac.db")
+            self.assertTrue(dump(self.data, DumperSQLite, output=output))
+            # The database is replaced by a second dump.
+            self.assertTrue(
+                dump(iter_load(self.localPath, LoaderOFACXML), DumperSQLite, output=output)
+            )
+            connection = sqlite3.connect(output)
+            try:
+                plan = connection.execute(
+                    "EXPLAIN QUERY PLAN SELECT * FROM identifications WHERE identification_id = ?",
+                    ("x",)
+                ).fetchall()
+                names = connection.execute(
+                    "SELECT names.id, names.whole_name FROM names_fts "
+                    "JOIN names ON names.rowid = names_fts.rowid "
+                    "WHERE names_fts MATCH 'haniya'"
+                ).fetchall()
+                count = connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            finally:
+                connection.close()
+        self.assertIn("identifications_identification_id", plan[0][-1])
+        self.assertEqual(names, [("9639", "ISMAIL ABDUL SALAH HANIYA"), ("9639", "ISMAIL HANIYA")])
+        self.assertEqual(count, len(self.data["list_entries"]))
+
+    def test_failed_dump_keeps_database(self):
+        def failingListEntries():
+            for i, listEntry in enumerate(self.data["list_entries"]):
+                if i == 200:
+                    raise Exception("Broken source")
+                yield listEntry
+        with tempfile.TemporaryDirectory() as outputDir:
+            output = Path(outputDir, "ofac.db")
+            self.assertTrue(dump(self.data, DumperSQLite, output=output))
+            connection = sqlite3.connect(output)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.close()
+            self.assertFalse(dump(failingListEntries(), DumperSQLite, output=output))
+            connection = sqlite3.connect(output)
+            try:
+                count = connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+                meta = connection.execute("SELECT COUNT(*) FROM meta").fetchone()[0]
+                indexes = connection.execute(
+                    "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index'"
+                ).fetchone()[0]
+                journalMode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+            finally:
+                connection.close()
+        self.assertEqual(count, len(self.data["list_entries"]))
+        self.assertGreater(meta, 0)
+        self.assertGreater(indexes, 0)
+        # The settings of an existing database are not changed.
+        self.assertEqual(journalMode, "wal")
+
+    def test_output_required(self):
+        with self.assertRaises(Exception):
+            dump(self.data, DumperSQLite)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,26 @@
 import unittest
-from inoutlists import Loader
+from pathlib import Path
+import os
+import gc
+import weakref
+from inoutlists import load, Loader, LoaderOFACXML, LoaderUNXML, StringInternTable
+
+class LoaderUNXMLCountries(LoaderUNXML):
+
+    def getISOCodeFromCountryName(self, countryName):
+        return "ZZ"
+
+    def getCountryNameFromISOCode(self, ISOCode):
+        return f"COUNTRY {ISOCode}"
+
+class LoaderUNXMLConfigured(LoaderUNXML):
+
+    def __init__(self, countryCodes, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.countryCodes = countryCodes
+
+    def getISOCodeFromCountryName(self, countryName):
+        return self.countryCodes.get(countryName, "00")
 
 class TestLoaderClass(unittest.TestCase):
 
@@ -35,5 +56,86 @@ class TestLoaderClass(unittest.TestCase):
                     f'Wrong country name for ISO Code {ISOCode}'
                 )
 
+    def test_reference_tables_shared(self):
+        loader = Loader("test")
+        self.assertIs(loader.countryNames, self.loader.countryNames)
+        self.assertIs(loader.countryISOCodes, self.loader.countryISOCodes)
+        with self.assertRaises(TypeError):
+            self.loader.countryNames["XXXXXXXXXX"] = "XX"
+
+    def test_OFAC_allowed_id_types(self):
+        loader = LoaderOFACXML()
+        self.assertIsInstance(loader.allowedIdTypes, frozenset)
+        self.assertIn("Passport", loader.allowedIdTypes)
+        self.assertIs(loader.allowedIdTypes, LoaderOFACXML().allowedIdTypes)
+
+    def test_intern_table(self):
+        table = StringInternTable(maxsize=2)
+        first = table.intern("".join(["SP", "AIN"]))
+        second = table.intern("".join(["SPA", "IN"]))
+        self.assertIs(first, second)
+        table.intern("FRANCE")
+        overflow = "".join(["ITA", "LY"])
+        self.assertIs(table.intern(overflow), overflow)
+        info = table.info()
+        self.assertEqual(info["size"], 2)
+        self.assertEqual(info["hits"], 1)
+        self.assertEqual(info["misses"], 3)
+        self.assertGreater(info["bytes"], 0)
+        table.clear()
+        self.assertEqual(table.info()["size"], 0)
+        self.assertIs(self.loader.internTable, LoaderOFACXML().internTable)
+
+    def test_normalizers(self):
+        loader = LoaderOFACXML()
+        LoaderOFACXML.normalizerCache.clear()
+        for _ in range(3):
+            self.assertEqual(loader.resolveCountry("USSR"), ("SU", "USSR"))
+            self.assertEqual(loader.normalizeUpperText("  West   bank "), "WEST BANK")
+            self.assertEqual(loader.normalizeOFACDate("05 Jan 1970"), "1970-01-05")
+        info = LoaderOFACXML.normalizerCache.info()
+        for name in ["normalizeUpperText", "getISODateFromOFACDate"]:
+            with self.subTest(name=name):
+                self.assertEqual(info[name]["hits"], 2)
+                self.assertEqual(info[name]["misses"], 1)
+                self.assertAlmostEqual(info[name]["hit_ratio"], 2 / 3)
+        self.assertEqual(loader.resolveCountry.cache_info().hits, 2)
+        self.assertEqual(loader.resolveCountry.cache_info().misses, 1)
+        self.assertIsNot(LoaderOFACXML.normalizerCache, LoaderUNXML.normalizerCache)
+
+    def test_country_instances(self):
+        loaderA = LoaderUNXMLConfigured({"IRAQ": "XA"})
+        loaderB = LoaderUNXMLConfigured({"IRAQ": "XB"})
+        self.assertEqual(loaderA.resolveCountry("IRAQ"), ("XA", "UNKNOWN"))
+        self.assertEqual(loaderB.resolveCountry("IRAQ"), ("XB", "UNKNOWN"))
+        self.assertEqual(LoaderUNXML().resolveCountry("IRAQ"), ("IQ", "IRAQ"))
+        # The caches of the class do not keep the loader objects alive.
+        reference = weakref.ref(loaderA)
+        del loaderA
+        gc.collect()
+        self.assertIsNone(reference())
+
+    def test_country_hooks(self):
+        localPath = Path(
+            Path(os.path.realpath(__file__)).parent.parent,
+            Path("./integration/fixtures/un_consolidated.xml")
+        )
+        data = load(localPath, LoaderUNXMLCountries)
+        addresses = [
+            address 
+            for listEntry in data["list_entries"] 
+            for address in listEntry.get("addresses", [])
+        ]
+        self.assertGreater(len(addresses), 0)
+        for address in addresses:
+            self.assertEqual(address["country_ISO_code"], "ZZ")
+            self.assertEqual(address["country_desc"], "COUNTRY ZZ")
+            # The free text fields are not interned.
+            if len(address["city"]) > 0:
+                self.assertIsNot(
+                    address["city"], 
+                    Loader.internTable.strings.get(address["city"])
+                )
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
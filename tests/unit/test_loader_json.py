@@ -0,0 +1,86 @@
+import unittest
+from pathlib import Path
+import os
+import io
+import gzip
+import json
+import tempfile
+from inoutlists import load, iter_load, dump, LoaderOFACXML, LoaderJSON, DumperJSON
+from inoutlists import JSONBackend, ListEntry, ListStore
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class TestLoaderJSON(unittest.TestCase):
+
+    def setUp(self):
+        self.fixturesPath = Path(
+            Path(os.path.realpath(__file__)).parent.parent,
+            Path("./integration/fixtures")
+        )
+        self.localPath = Path(self.fixturesPath, "consolidated.xml")
+        self.data = load(self.localPath, LoaderOFACXML)
+
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as outputDir:
+            for fileName in ["ofac.json", "ofac.json.gz", "ofac.json.xz"]:
+                with self.subTest(fileName=fileName):
+                    output = Path(outputDir, fileName)
+                    self.assertTrue(dump(self.data, DumperJSON, output=output))
+                    self.assertEqual(load(output, LoaderJSON), self.data)
+            with gzip.open(Path(outputDir, "ofac.json.gz"), mode="rb") as f:
+                content = f.read()
+        # The output of the JSON package is the same as json.dump.
+        self.assertEqual(content.decode("utf-8"), json.dumps(self.data))
+
+    def test_file_objects(self):
+        output = io.BytesIO()
+        self.assertTrue(dump(self.data, DumperJSON, output=output, compression="gzip"))
+        self.assertFalse(output.closed)
+        output.seek(0)
+        self.assertEqual(load(output, LoaderJSON), self.data)
+        output = io.StringIO()
+        self.assertTrue(dump(self.data, DumperJSON, output=output))
+        output.seek(0)
+        self.assertEqual(load(output, LoaderJSON), self.data)
+        self.assertEqual(load(dump(self.data, DumperJSON), LoaderJSON), self.data)
+
+    def test_records_store_and_iter_load(self):
+        content = dump(self.data, DumperJSON)
+        records = load(content, LoaderJSON, records=True)
+        self.assertIsInstance(records["list_entries"][0], ListEntry)
+        store = load(content, LoaderJSON, store=True, description="OFAC")
+        self.assertIsInstance(store["list_entries"], ListStore)
+        self.assertEqual(store["list_entries"].to_list(), self.data["list_entries"])
+        self.assertEqual(store["meta"]["description"], "OFAC")
+        chunks = list(iter_load(content, LoaderJSON, chunksize=1000))
+        self.assertEqual(sum(len(chunk) for chunk in chunks), len(self.data["list_entries"]))
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson(self):
+        content = dump(self.data, DumperJSON, backend="orjson")
+        self.assertEqual(json.loads(content), self.data)
+        self.assertEqual(load(content.encode("utf-8"), LoaderJSON, backend="orjson"), self.data)
+        self.assertEqual(
+            json.loads(dump(self.data, DumperJSON, backend="auto", sort_keys=True, indent=2)),
+            self.data
+        )
+        with self.assertRaises(Exception):
+            dump(self.data, DumperJSON, backend="orjson", indent=4)
+
+    def test_backends(self):
+        class CountingBackend(JSONBackend):
+            calls = 0
+            def dumps(self, obj, **kwargs):
+                CountingBackend.calls += 1
+                return super().dumps(obj, **kwargs)
+        content = dump(self.data, DumperJSON, backend=CountingBackend())
+        self.assertEqual(CountingBackend.calls, 1)
+        self.assertEqual(json.loads(content), self.data)
+        with self.assertRaises(Exception):
+            dump(self.data, DumperJSON, backend="simplejson")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,223 @@
+import unittest
+import lxml.etree as ET
+from pathlib import Path
+import os
+from concurrent.futures import ThreadPoolExecutor
+import inoutlists
+from inoutlists import load, iter_load, load_many, XMLFields, LoadContext
+from inoutlists import LoaderXML, LoaderOFACXML, LoaderUNXML
+
+class TestLoaderXML(unittest.TestCase):
+
+    def setUp(self):
+        self.fixturesPath = Path(
+            Path(os.path.realpath(__file__)).parent.parent,
+            Path("./integration/fixtures")
+        )
+        self.sources = {
+            "OFACCONS": {
+                "localPath": Path(self.fixturesPath, "consolidated.xml"),
+                "loader": LoaderOFACXML
+            },
+            "UN": {
+                "localPath": Path(self.fixturesPath, "un_consolidated.xml"),
+                "loader": LoaderUNXML
+            }
+        }
+
+    def test_streaming_same_output(self):
+        for source, sourceInfo in self.sources.items():
+            with self.subTest(source=source):
+                dataTree = load(
+                    sourceInfo["localPath"],
+                    sourceInfo["loader"],
+                    f"Test {source}"
+                )
+                dataStream = load(
+                    sourceInfo["localPath"],
+                    sourceInfo["loader"],
+                    f"Test {source}",
+                    streaming=True
+                )
+                self.assertEqual(
+                    dataTree,
+                    dataStream,
+                    f"Source: {source}. Streaming load differs from tree load."
+                )
+
+    def test_workers_same_output(self):
+        for source, sourceInfo in self.sources.items():
+            for streaming in [False, True]:
+                with self.subTest(source=source, streaming=streaming):
+                    dataTree = load(
+                        sourceInfo["localPath"],
+                        sourceInfo["loader"],
+                        f"Test {source}"
+                    )
+                    dataWorkers = load(
+                        sourceInfo["localPath"],
+                        sourceInfo["loader"],
+                        f"Test {source}",
+                        streaming=streaming,
+                        workers=2
+                    )
+                    self.assertEqual(
+                        dataTree,
+                        dataWorkers,
+                        f"Source: {source}. Parallel load differs from tree load."
+                    )
+
+    def test_iter_load_same_output(self):
+        for source, sourceInfo in self.sources.items():
+            for streaming in [False, True]:
+                with self.subTest(source=source, streaming=streaming):
+                    data = load(
+                        sourceInfo["localPath"],
+                        sourceInfo["loader"],
+                        streaming=streaming
+                    )
+                    listEntries = list(
+                        iter_load(
+                            sourceInfo["localPath"],
+                            sourceInfo["loader"],
+                            streaming=streaming
+                        )
+                    )
+                    self.assertEqual(data["list_entries"], listEntries)
+
+    def test_iter_load_chunksize(self):
+        data = load(self.sources["UN"]["localPath"], LoaderUNXML)
+        chunks = list(
+            iter_load(
+                self.sources["UN"]["localPath"], 
+                LoaderUNXML, 
+                chunksize=100
+            )
+        )
+        self.assertTrue(all(len(chunk) == 100 for chunk in chunks[:-1]))
+        self.assertTrue(0 < len(chunks[-1]) <= 100)
+        self.assertEqual(
+            data["list_entries"],
+            [listEntry for chunk in chunks for listEntry in chunk]
+        )
+
+    def test_load_many(self):
+        sources = {
+            source: (sourceInfo["localPath"], sourceInfo["loader"])
+            for source, sourceInfo in self.sources.items()
+        }
+        sources["WRONG"] = (
+            self.sources["UN"]["localPath"], 
+            LoaderUNXML, 
+            {"schema": "Not a path"}
+        )
+        results = load_many(sources)
+        for source, sourceInfo in self.sources.items():
+            with self.subTest(source=source):
+                self.assertIsNone(results[source]["error"])
+                self.assertGreaterEqual(results[source]["elapsed"], 0)
+                self.assertEqual(
+                    results[source]["data"],
+                    load(sourceInfo["localPath"], sourceInfo["loader"])
+                )
+        self.assertIsNone(results["WRONG"]["data"])
+        self.assertIsInstance(results["WRONG"]["error"], Exception)
+
+    def test_shared_loader(self):
+        for source, sourceInfo in self.sources.items():
+            with self.subTest(source=source):
+                data = load(sourceInfo["localPath"], sourceInfo["loader"])
+                loaders = [sourceInfo["loader"](), sourceInfo["loader"](streaming=True)]
+                with ThreadPoolExecutor(max_workers=4) as executor:
+                    results = list(
+                        executor.map(
+                            lambda i: loaders[i % 2].load(sourceInfo["localPath"]),
+                            range(8)
+                        )
+                    )
+                for result in results:
+                    self.assertEqual(result, data)
+                for loader in loaders:
+                    self.assertEqual(loader.meta, {"description": ""})
+
+    def test_iter_list_entries_context(self):
+        loader = LoaderUNXML(streaming=True)
+        context = LoadContext(loader.meta)
+        listEntries = list(
+            loader.iterListEntries(self.sources["UN"]["localPath"], context=context)
+        )
+        data = load(self.sources["UN"]["localPath"], LoaderUNXML)
+        self.assertEqual(listEntries, data["list_entries"])
+        self.assertEqual(context.meta, data["meta"])
+
+    def test_schema_cache(self):
+        LoaderXML.schemaCache.invalidate()
+        self.assertEqual(LoaderXML.schemaCache.info()["size"], 0)
+        for streaming in [False, True]:
+            load(
+                self.sources["UN"]["localPath"], 
+                LoaderUNXML, 
+                streaming=streaming
+            )
+        info = LoaderXML.schemaCache.info()
+        self.assertEqual(info["size"], 1)
+        self.assertGreaterEqual(info["hits"], 1)
+        LoaderXML.schemaCache.invalidate(LoaderUNXML().schema)
+        self.assertEqual(LoaderXML.schemaCache.info()["size"], 0)
+
+    def test_xml_fields(self):
+        element = ET.fromstring(
+            '<entry xmlns="urn:test" code=" A1 "><uid> 36 </uid><empty/>'
+            '<akaList><aka><lastName>X</lastName></aka><aka><lastName>Y</lastName></aka></akaList>'
+            '</entry>'
+        )
+        fields = XMLFields(element)
+        self.assertEqual(fields.childText("uid"), "36")
+        self.assertEqual(fields.childText("empty"), "")
+        self.assertEqual(fields.childText("missing"), "")
+        self.assertEqual(fields.attribValue("code"), "A1")
+        self.assertEqual(
+            [aka.childText("lastName") for aka in fields.subFields("akaList", "aka")],
+            ["X", "Y"]
+        )
+        self.assertIs(fields.subFields("akaList", "aka"), fields.subFields("akaList", "aka"))
+
+    def test_xml_fields_element_methods(self):
+        element = ET.fromstring(
+            '<entry xmlns="urn:test" code="A1"><uid>36</uid><akaList><aka/><aka/></akaList></entry>'
+        )
+        fields = XMLFields(element)
+        ns = {"t": "urn:test"}
+        self.assertEqual(fields.tag, "{urn:test}entry")
+        self.assertIsNone(fields.text)
+        self.assertEqual(fields.attrib["code"], "A1")
+        self.assertEqual(fields.fields("uid")[0].text, "36")
+        self.assertEqual(fields.get("code"), "A1")
+        self.assertEqual(fields.findtext("t:uid", namespaces=ns), "36")
+        self.assertEqual(LoaderXML.lxmlFindText(fields, "t:uid", ns), "36")
+        self.assertEqual(LoaderXML.lxmlGetAttribValue(fields, "code"), "A1")
+        self.assertIs(fields.find("t:akaList", ns), element[1])
+        self.assertEqual(len(fields.findall("t:akaList/t:aka", ns)), 2)
+        self.assertEqual([child.tag for child in fields], [child.tag for child in element])
+
+    def test_removed_loader_state(self):
+        loader = LoaderOFACXML()
+        for name in ["ns", "data"]:
+            with self.subTest(name=name):
+                with self.assertRaisesRegex(AttributeError, "context"):
+                    getattr(loader, name)
+
+    def test_streaming_schema_validation_error(self):
+        inoutlistsPath = Path(os.path.dirname(inoutlists.__file__))
+        self.assertRaises(
+            Exception,
+            load,
+            self.sources["UN"]["localPath"],
+            loader=LoaderUNXML,
+            description="Test invalid schema",
+            schema=Path(inoutlistsPath, "OFAC_xml.xsd"),
+            streaming=True
+        )
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from pathlib import Path
+import os
+import pickle
+from inoutlists import load, LoaderOFACXML, LoaderUNXML, NameIndex
+
+class TestNameIndex(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        fixturesPath = Path(
+            Path(os.path.realpath(__file__)).parent.parent,
+            Path("./integration/fixtures")
+        )
+        cls.OFAC = load(Path(fixturesPath, "consolidated.xml"), LoaderOFACXML)
+        cls.UN = load(Path(fixturesPath, "un_consolidated.xml"), LoaderUNXML, records=True)
+        cls.index = NameIndex()
+        cls.index.add(cls.OFAC, name="OFAC")
+        cls.index.add(cls.UN, name="UN")
+
+    def bruteForce(self, name, threshold):
+        # Best score of every list entry scoring all the names.
+        query = NameIndex.getFeatures(NameIndex.normalize(name))
+        scores = {}
+        for (entry, _, _), features in zip(self.index.names, self.index.nameFeatures):
+            score = 2 * len(query & features) / (len(query) + len(features))
+            if score >= threshold:
+                key = self.index.entries[entry][:2]
+                scores[key] = max(scores.get(key, 0), score)
+        return scores
+
+    def test_normalize(self):
+        self.assertEqual(NameIndex.normalize("  Haniyá,  Ismail-Abdel "), "HANIYA ISMAIL ABDEL")
+
+    def test_search(self):
+        candidates = self.index.search("Haniyah, Ismail")
+        self.assertEqual(candidates[0]["list"], "OFAC")
+        self.assertEqual(candidates[0]["id"], "9639")
+        self.assertEqual(candidates[0]["whole_name"], "ISMAIL HANIYA")
+        self.assertTrue(candidates[0]["strong"])
+        self.assertGreaterEqual(candidates[0]["score"], 0.8)
+        self.assertEqual(self.index.search("ismail haniya")[0]["score"], 1.0)
+        self.assertEqual(self.index.search("...", 0.5), [])
+
+    def test_search_same_as_brute_force(self):
+        names = [
+            name["whole_name"] 
+            for listEntry in self.OFAC["list_entries"][:40] 
+            for name in listEntry["names"]
+        ] + ["Mohamad Hasan", "ali"]
+        for name in names:
+            for threshold in [0.4, 0.8, 1.0]:
+                with self.subTest(name=name, threshold=threshold):
+                    candidates = self.index.search(name, threshold, limit=None)
+                    self.assertEqual(
+                        {(candidate["list"], candidate["id"]): candidate["score"] for candidate in candidates},
+                        self.bruteForce(name, threshold)
+                    )
+                    scores = [candidate["score"] for candidate in candidates]
+                    self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_limit_info_and_pickle(self):
+        self.assertEqual(len(self.index.search("Mohammed", 0.3, limit=5)), 5)
+        info = self.index.info()
+        self.assertEqual(info["lists"], 2)
+        self.assertEqual(
+            info["entries"], 
+            len(self.OFAC["list_entries"]) + len(self.UN["list_entries"])
+        )
+        index = pickle.loads(pickle.dumps(self.index))
+        self.assertEqual(index.search("Haniyah, Ismail"), self.index.search("Haniyah, Ismail"))
+        with self.assertRaises(Exception):
+            self.index.search("Haniyah", threshold=0)
+
+if __name__ == '__main__':
+    unittest.main()
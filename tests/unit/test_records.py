@@ -0,0 +1,48 @@
+import unittest
+from pathlib import Path
+import os
+import json
+import pickle
+from inoutlists import load, dump, LoaderUNXML, DumperJSON, DumperPandas
+from inoutlists import ListEntry, Name
+
+class TestRecords(unittest.TestCase):
+
+    def setUp(self):
+        self.localPath = Path(
+            Path(os.path.realpath(__file__)).parent.parent,
+            Path("./integration/fixtures/un_consolidated.xml")
+        )
+        self.data = load(self.localPath, LoaderUNXML)
+        self.dataRecords = load(self.localPath, LoaderUNXML, records=True)
+
+    def test_records_to_dict(self):
+        self.assertIsInstance(self.dataRecords["list_entries"][0], ListEntry)
+        self.assertIsInstance(self.dataRecords["list_entries"][0].names[0], Name)
+        self.assertEqual(
+            [listEntry.to_dict() for listEntry in self.dataRecords["list_entries"]],
+            self.data["list_entries"]
+        )
+
+    def test_records_from_dict(self):
+        for listEntry in self.data["list_entries"]:
+            with self.subTest(listEntryId=listEntry["id"]):
+                self.assertEqual(ListEntry.from_dict(listEntry).to_dict(), listEntry)
+
+    def test_records_pickle(self):
+        self.assertEqual(
+            pickle.loads(pickle.dumps(self.dataRecords))["list_entries"],
+            self.dataRecords["list_entries"]
+        )
+
+    def test_dumpers_accept_records(self):
+        self.assertEqual(
+            json.loads(dump(self.dataRecords, DumperJSON)),
+            json.loads(dump(self.data, DumperJSON))
+        )
+        self.assertTrue(
+            dump(self.dataRecords, DumperPandas).equals(dump(self.data, DumperPandas))
+        )
+
+if __name__ == '__main__':
+    unittest.main()
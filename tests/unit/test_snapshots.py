@@ -0,0 +1,76 @@
+import unittest
+from pathlib import Path
+import os
+import shutil
+import pickle
+import tempfile
+from inoutlists import load, SnapshotCache, LoaderUNXML
+
+class LoaderUNXMLNext(LoaderUNXML):
+
+    version = "2"
+
+class TestSnapshotCache(unittest.TestCase):
+
+    def setUp(self):
+        self.fixturesPath = Path(
+            Path(os.path.realpath(__file__)).parent.parent,
+            Path("./integration/fixtures")
+        )
+        self.localPath = Path(self.fixturesPath, "un_consolidated.xml")
+        self.cacheDir = tempfile.mkdtemp()
+        self.snapshotCache = SnapshotCache(self.cacheDir)
+
+    def tearDown(self):
+        shutil.rmtree(self.cacheDir)
+
+    def test_hit_same_output(self):
+        data = load(self.localPath, LoaderUNXML)
+        for _ in range(2):
+            self.assertEqual(
+                load(self.localPath, LoaderUNXML, snapshot_cache=self.snapshotCache),
+                data
+            )
+        info = self.snapshotCache.info()
+        self.assertEqual((info["hits"], info["misses"], info["size"]), (1, 1, 1))
+
+    def test_key(self):
+        load(self.localPath, LoaderUNXML, snapshot_cache=self.snapshotCache)
+        load(self.localPath, LoaderUNXML, snapshot_cache=self.snapshotCache, records=True)
+        load(self.localPath, LoaderUNXMLNext, snapshot_cache=self.snapshotCache)
+        with open(self.localPath, mode="r", encoding="utf-8") as f:
+            data = f.read()
+        load(data.replace("Al-Qaida", "Al-Qaeda"), LoaderUNXML, snapshot_cache=self.snapshotCache)
+        self.assertEqual(self.snapshotCache.info()["size"], 4)
+        self.assertEqual(self.snapshotCache.info()["hits"], 0)
+
+    def test_eviction(self):
+        load(self.localPath, LoaderUNXML, snapshot_cache=self.snapshotCache)
+        size = self.snapshotCache.info()["bytes"]
+        snapshotCache = SnapshotCache(self.cacheDir, max_size=size)
+        load(self.localPath, LoaderUNXML, snapshot_cache=snapshotCache, store=True)
+        self.assertEqual(snapshotCache.info()["size"], 1)
+        load(self.localPath, LoaderUNXML, snapshot_cache=snapshotCache, store=True)
+        self.assertEqual(snapshotCache.info()["hits"], 1)
+
+    def test_file_object(self):
+        data = load(self.localPath, LoaderUNXML)
+        for _ in range(2):
+            with open(self.localPath, mode="rb") as f:
+                self.assertEqual(
+                    load(f, LoaderUNXML, snapshot_cache=self.snapshotCache)["list_entries"],
+                    data["list_entries"]
+                )
+        self.assertEqual(self.snapshotCache.info()["hits"], 1)
+
+    def test_stale_snapshot_is_miss(self):
+        # A snapshot that cannot be unpickled any more, as a pickle of a
+        # class that was renamed, is a miss.
+        key = "stale"
+        with open(self.snapshotCache.getPath(key), mode="wb") as f:
+            f.write(pickle.dumps(LoaderUNXMLNext).replace(b"LoaderUNXMLNext", b"LoaderUNXMLGone"))
+        self.assertIsNone(self.snapshotCache.get(key))
+        self.assertEqual(self.snapshotCache.info()["misses"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
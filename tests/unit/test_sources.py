@@ -0,0 +1,161 @@
+import unittest
+from pathlib import Path
+import os
+import tempfile
+import threading
+import gzip
+import bz2
+import lzma
+import zipfile
+import shutil
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from inoutlists import load, HTTPClient, SnapshotCache, LoaderUNXML
+
+class QuietHTTPRequestHandler(SimpleHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+class TestHTTPClient(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.fixturesPath = Path(
+            Path(os.path.realpath(__file__)).parent.parent,
+            Path("./integration/fixtures")
+        )
+        cls.server = ThreadingHTTPServer(
+            ("127.0.0.1", 0),
+            partial(QuietHTTPRequestHandler, directory=str(cls.fixturesPath))
+        )
+        cls.serverThread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.serverThread.start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/un_consolidated.xml"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_conditional_get(self):
+        with tempfile.TemporaryDirectory() as cacheDir:
+            client = HTTPClient(cache_dir=cacheDir, retries=0)
+            dataFirst = load(self.url, LoaderUNXML, http_client=client)
+            self.assertEqual(client.info(), {"hits": 0, "misses": 1})
+            dataSecond = load(self.url, LoaderUNXML, http_client=client)
+            self.assertEqual(client.info(), {"hits": 1, "misses": 1})
+            self.assertEqual(dataFirst, dataSecond)
+            self.assertEqual(
+                dataSecond["list_entries"],
+                load(Path(self.fixturesPath, "un_consolidated.xml"), LoaderUNXML)["list_entries"]
+            )
+
+    def test_snapshot_cache_url(self):
+        with tempfile.TemporaryDirectory() as cacheDir:
+            client = HTTPClient(retries=0)
+            snapshotCache = SnapshotCache(cacheDir)
+            for streaming in [False, True]:
+                data = load(
+                    self.url, 
+                    LoaderUNXML, 
+                    http_client=client, 
+                    snapshot_cache=snapshotCache,
+                    streaming=streaming
+                )
+                self.assertEqual(data, load(self.url, LoaderUNXML, http_client=client))
+            self.assertEqual(snapshotCache.info()["hits"], 1)
+            self.assertEqual(snapshotCache.info()["misses"], 1)
+
+    def test_conditional_get_streaming(self):
+        with tempfile.TemporaryDirectory() as cacheDir:
+            client = HTTPClient(cache_dir=cacheDir, retries=0)
+            dataFirst = load(self.url, LoaderUNXML, http_client=client, streaming=True)
+            dataSecond = load(self.url, LoaderUNXML, http_client=client, streaming=True)
+            self.assertEqual(client.info(), {"hits": 1, "misses": 1})
+            self.assertEqual(dataFirst, dataSecond)
+            self.assertEqual(
+                dataFirst, 
+                load(self.url, LoaderUNXML, http_client=client)
+            )
+
+    def test_not_modified_without_body(self):
+        class HTTPClientLostBody(HTTPClient):
+            # The cached body disappears after the conditional headers are built.
+            def getConditionalHeaders(self, bodyPath, metaPath):
+                headers = super().getConditionalHeaders(bodyPath, metaPath)
+                if bodyPath is not None:
+                    bodyPath.unlink(missing_ok=True)
+                return headers
+        with open(Path(self.fixturesPath, "un_consolidated.xml"), mode="rb") as f:
+            content = f.read()
+        with tempfile.TemporaryDirectory() as cacheDir:
+            HTTPClient(cache_dir=cacheDir, retries=0).get(self.url)
+            client = HTTPClientLostBody(cache_dir=cacheDir, retries=0)
+            self.assertEqual(client.get(self.url), content)
+            self.assertEqual(client.info(), {"hits": 0, "misses": 1})
+            client = HTTPClient(cache_dir=cacheDir, retries=0)
+            self.assertEqual(client.get(self.url), content)
+            self.assertEqual(client.info(), {"hits": 1, "misses": 0})
+
+    def test_no_cache(self):
+        client = HTTPClient(retries=0)
+        load(self.url, LoaderUNXML, http_client=client)
+        load(self.url, LoaderUNXML, http_client=client)
+        self.assertEqual(client.info(), {"hits": 0, "misses": 2})
+
+class TestCompressedSources(unittest.TestCase):
+
+    def setUp(self):
+        self.fixturesPath = Path(
+            Path(os.path.realpath(__file__)).parent.parent,
+            Path("./integration/fixtures")
+        )
+        self.xmlPath = Path(self.fixturesPath, "un_consolidated.xml")
+        self.tmpDir = tempfile.TemporaryDirectory()
+        self.compressedPaths = {}
+        for compressionFormat, opener in {"gz": gzip.open, "bz2": bz2.open, "xz": lzma.open}.items():
+            compressedPath = Path(self.tmpDir.name, f"un_consolidated.xml.{compressionFormat}")
+            with open(self.xmlPath, mode="rb") as fIn, opener(compressedPath, mode="wb") as fOut:
+                shutil.copyfileobj(fIn, fOut)
+            self.compressedPaths[compressionFormat] = compressedPath
+        zipPath = Path(self.tmpDir.name, "un_consolidated.zip")
+        with zipfile.ZipFile(zipPath, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.write(self.xmlPath, arcname="un_consolidated.xml")
+        self.compressedPaths["zip"] = zipPath
+        # Compression is detected from the content, not from the name.
+        noExtensionPath = Path(self.tmpDir.name, "un_consolidated")
+        shutil.copyfile(self.compressedPaths["gz"], noExtensionPath)
+        self.compressedPaths["no extension"] = noExtensionPath
+
+    def tearDown(self):
+        self.tmpDir.cleanup()
+
+    def test_compressed_files(self):
+        data = load(self.xmlPath, LoaderUNXML)
+        for compressionFormat, compressedPath in self.compressedPaths.items():
+            for streaming in [False, True]:
+                with self.subTest(compressionFormat=compressionFormat, streaming=streaming):
+                    dataCompressed = load(compressedPath, LoaderUNXML, streaming=streaming)
+                    self.assertEqual(data["list_entries"], dataCompressed["list_entries"])
+
+    def test_compressed_urls(self):
+        server = ThreadingHTTPServer(
+            ("127.0.0.1", 0),
+            partial(QuietHTTPRequestHandler, directory=self.tmpDir.name)
+        )
+        serverThread = threading.Thread(target=server.serve_forever, daemon=True)
+        serverThread.start()
+        try:
+            data = load(self.xmlPath, LoaderUNXML)
+            for compressionFormat, compressedPath in self.compressedPaths.items():
+                with self.subTest(compressionFormat=compressionFormat):
+                    url = f"http://127.0.0.1:{server.server_address[1]}/{compressedPath.name}"
+                    dataCompressed = load(url, LoaderUNXML, streaming=True)
+                    self.assertEqual(data["list_entries"], dataCompressed["list_entries"])
+        finally:
+            server.shutdown()
+            server.server_close()
+
+if __name__ == '__main__':
+    unittest.main()
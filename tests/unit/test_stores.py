@@ -0,0 +1,69 @@
+import unittest
+from pathlib import Path
+import os
+import json
+from inoutlists import load, dump, ListStore, LoaderUNXML, DumperJSON, DumperPandas
+
+class TestListStore(unittest.TestCase):
+
+    def setUp(self):
+        self.fixturesPath = Path(
+            Path(os.path.realpath(__file__)).parent.parent,
+            Path("./integration/fixtures")
+        )
+        self.localPath = Path(self.fixturesPath, "un_consolidated.xml")
+        self.data = load(self.localPath, LoaderUNXML)
+        self.dataStore = load(self.localPath, LoaderUNXML, store=True)
+
+    def test_same_list_entries(self):
+        store = self.dataStore["list_entries"]
+        self.assertIsInstance(store, ListStore)
+        self.assertEqual(len(store), len(self.data["list_entries"]))
+        self.assertEqual(store.to_list(), self.data["list_entries"])
+        self.assertEqual(dict(store[-1]), self.data["list_entries"][-1])
+        self.assertRaises(IndexError, store.__getitem__, len(store))
+
+    def test_offsets(self):
+        store = self.dataStore["list_entries"]
+        offsets = store.offsets("names")
+        self.assertEqual(len(offsets), len(store) + 1)
+        self.assertEqual(
+            list(offsets[1:] - offsets[:-1]),
+            [len(listEntry["names"]) for listEntry in self.data["list_entries"]]
+        )
+        self.assertEqual(len(store.column("names", "strong")), offsets[-1])
+        names = store.toDataFrame("names")
+        self.assertEqual(len(names), offsets[-1])
+        self.assertEqual(names["id"].iloc[-1], self.data["list_entries"][-1]["id"])
+
+    def test_freeze(self):
+        store = ListStore()
+        store.extend(self.data["list_entries"][:10])
+        offsets = store.offsets("names")
+        strong = store.column("names", "strong")
+        # The copies do not block the store.
+        store.append(self.data["list_entries"][10])
+        self.assertEqual(len(store.offsets("names")), len(offsets) + 1)
+        store.freeze()
+        offsets = store.offsets("names")
+        self.assertFalse(offsets.flags.owndata)
+        self.assertFalse(store.column("names", "strong").flags.owndata)
+        self.assertTrue(strong.flags.owndata)
+        with self.assertRaises(Exception):
+            store.append(self.data["list_entries"][11])
+        self.assertEqual(len(store), 11)
+        # The stores of load are frozen once the load completes.
+        self.assertTrue(self.dataStore["list_entries"].frozen)
+        self.assertFalse(self.dataStore["list_entries"].offsets("names").flags.owndata)
+
+    def test_dumpers(self):
+        self.assertEqual(
+            json.loads(dump(self.dataStore, DumperJSON)),
+            json.loads(dump(self.data, DumperJSON))
+        )
+        self.assertTrue(
+            dump(self.dataStore, DumperPandas).equals(dump(self.data, DumperPandas))
+        )
+
+if __name__ == '__main__':
+    unittest.main()